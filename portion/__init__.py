@@ -1,9 +1,35 @@
 from .api import create_api
-from .const import Bound, inf
+from .const import Bound, Relation, inf
 from .interval import Interval, AbstractDiscreteInterval
-from .func import iterate, open, closed, openclosed, closedopen, empty, singleton
+from .numeric import FloatInterval, IntInterval
+from .func import (
+    iterate,
+    iterate_chunks,
+    open,
+    closed,
+    openclosed,
+    closedopen,
+    empty,
+    singleton,
+    overlap_join,
+    relations,
+)
 from .intervaltree import IntervalTree, Node
-from .io import from_string, to_string, from_data, to_data
+from .io import (
+    from_string,
+    from_strings,
+    from_file,
+    to_string,
+    to_file,
+    from_data,
+    to_data,
+    iter_data,
+    from_bytes,
+    to_bytes,
+    from_arrays,
+    to_arrays,
+)
+from .expression import lazy
 from .dict import IntervalDict
 
 
@@ -14,6 +40,8 @@ __all__ = [
     "OPEN",
     "Interval",
     "AbstractDiscreteInterval",
+    "FloatInterval",
+    "IntInterval",
     "open",
     "closed",
     "openclosed",
@@ -21,10 +49,23 @@ __all__ = [
     "singleton",
     "empty",
     "iterate",
+    "iterate_chunks",
+    "overlap_join",
+    "relations",
+    "Relation",
     "from_string",
+    "from_strings",
+    "from_file",
     "to_string",
+    "to_file",
     "from_data",
     "to_data",
+    "iter_data",
+    "from_bytes",
+    "to_bytes",
+    "from_arrays",
+    "to_arrays",
+    "lazy",
     "IntervalDict",
     "IntervalTree",
     "Node"
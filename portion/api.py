@@ -1,9 +1,35 @@
 import functools
-import importlib
+import importlib.machinery
+import importlib.util
 
-from .const import Bound, inf
-from .func import iterate, open, closed, openclosed, closedopen, empty, singleton
-from .io import from_string, to_string, from_data, to_data
+from .const import Bound, Relation
+from .func import (
+    iterate,
+    iterate_chunks,
+    open,
+    closed,
+    openclosed,
+    closedopen,
+    empty,
+    singleton,
+    overlap_join,
+    relations,
+)
+from .io import (
+    from_string,
+    from_strings,
+    from_file,
+    to_string,
+    to_file,
+    from_data,
+    to_data,
+    iter_data,
+    from_bytes,
+    to_bytes,
+    from_arrays,
+    to_arrays,
+)
+from .expression import lazy
 from .dict import IntervalDict
 
 
@@ -43,7 +69,7 @@ def create_api(interval, *, interval_dict=None, name=None):
         )
 
     objects = {
-        "inf": inf,
+        "inf": interval._inf,
         "CLOSED": Bound.CLOSED,
         "OPEN": Bound.OPEN,
         "Interval": interval,
@@ -54,10 +80,23 @@ def create_api(interval, *, interval_dict=None, name=None):
         "singleton": partial(singleton, klass=interval),
         "empty": partial(empty, klass=interval),
         "iterate": iterate,
+        "iterate_chunks": iterate_chunks,
+        "overlap_join": overlap_join,
+        "relations": relations,
+        "Relation": Relation,
         "from_string": partial(from_string, klass=interval),
+        "from_strings": partial(from_strings, klass=interval),
+        "from_file": partial(from_file, klass=interval),
         "to_string": to_string,
+        "to_file": to_file,
         "from_data": partial(from_data, klass=interval),
         "to_data": to_data,
+        "iter_data": iter_data,
+        "from_bytes": partial(from_bytes, klass=interval, dict_klass=interval_dict),
+        "to_bytes": to_bytes,
+        "from_arrays": partial(from_arrays, klass=interval),
+        "to_arrays": to_arrays,
+        "lazy": lazy,
         "IntervalDict": interval_dict,
     }
 
@@ -0,0 +1,396 @@
+import numpy
+
+from .const import Bound, inf
+from .interval import Atomic, Interval, _EMPTY, _LEFT_CLOSED, _MANY, _RIGHT_CLOSED
+
+
+def _encode(bound):
+    """
+    Convert a bound to a float, mapping infinities to float ones.
+    """
+    if bound == inf:
+        return numpy.inf
+    elif bound == -inf:
+        return -numpy.inf
+    else:
+        return bound
+
+
+def _decode(value):
+    """
+    Convert a float to a bound, mapping float infinities to P.inf and -P.inf.
+    """
+    if value == numpy.inf:
+        return inf
+    elif value == -numpy.inf:
+        return -inf
+    else:
+        return value
+
+
+def _sweep(lowers, uppers, left_closed, right_closed, threshold):
+    """
+    Compute the parts of the domain that are covered by at least threshold
+    atomic intervals.
+
+    Each bound is seen as a cut between two points of the domain: a cut is a
+    pair (value, side) where side is 0 if the cut is just before value, and 1
+    if it is just after. Cuts are sorted (starting cuts first to merge adjacent
+    intervals) and a cumulative sum of +1 (start) and -1 (end) gives the number
+    of atomic intervals covering each part of the domain.
+
+    :param lowers: array of lower bounds.
+    :param uppers: array of upper bounds.
+    :param left_closed: boolean array, True if lower bound is closed.
+    :param right_closed: boolean array, True if upper bound is closed.
+    :param threshold: minimal number of covering atomic intervals.
+    :return: a 4-uple of arrays, corresponding to sorted and disjoint atomic
+        intervals.
+    """
+    n = len(lowers)
+    values = numpy.concatenate([lowers, uppers])
+    sides = numpy.concatenate([~left_closed, right_closed]).astype(numpy.int8)
+    deltas = numpy.concatenate(
+        [numpy.ones(n, dtype=numpy.int64), -numpy.ones(n, dtype=numpy.int64)]
+    )
+
+    order = numpy.lexsort((-deltas, sides, values))
+    values, sides, deltas = values[order], sides[order], deltas[order]
+
+    coverage = numpy.cumsum(deltas)
+    before = coverage - deltas
+    opening = (before < threshold) & (coverage >= threshold)
+    closing = (before >= threshold) & (coverage < threshold)
+
+    start_values, start_sides = values[opening], sides[opening]
+    end_values, end_sides = values[closing], sides[closing]
+
+    # Drop parts that do not contain any point (e.g. when intervals touch)
+    keep = (start_values < end_values) | (
+        (start_values == end_values) & (start_sides < end_sides)
+    )
+    return (
+        start_values[keep],
+        end_values[keep],
+        start_sides[keep] == 0,
+        end_sides[keep] == 1,
+    )
+
+
+def _complement(lowers, uppers, left_closed, right_closed):
+    """
+    Compute the complement of sorted and disjoint atomic intervals.
+
+    :return: a 4-uple of arrays, corresponding to sorted and disjoint atomic
+        intervals.
+    """
+    c_lowers = numpy.concatenate([[-numpy.inf], uppers])
+    c_uppers = numpy.concatenate([lowers, [numpy.inf]])
+    c_left_closed = numpy.concatenate([[False], ~right_closed])
+    c_right_closed = numpy.concatenate([~left_closed, [False]])
+
+    # Complement of a leading or trailing infinity is empty
+    keep = (c_lowers < c_uppers) | (
+        (c_lowers == c_uppers) & c_left_closed & c_right_closed
+    )
+    return (
+        c_lowers[keep],
+        c_uppers[keep],
+        c_left_closed[keep],
+        c_right_closed[keep],
+    )
+
+
+class ArrayInterval(Interval):
+    """
+    This class represents an interval whose bounds are numbers (e.g. float
+    timestamps).
+
+    Instead of a list of atomic intervals, an ArrayInterval stores four parallel
+    numpy arrays: the lower bounds, the upper bounds, and whether they are
+    closed. Bounds are stored as floats, infinities included (P.inf and float
+    ones are considered equivalent), and are converted back to P.inf and -P.inf
+    when the atomic intervals are accessed. Intersection, union, complement,
+    difference, overlap and containment tests are vectorized.
+
+    This class requires numpy, and is still experimental.
+    """
+
+    __slots__ = ("_lower_values", "_upper_values", "_left_closed", "_right_closed")
+
+    def __init__(self, *intervals):
+        """
+        Create a disjunction of zero, one or more intervals.
+
+        :param intervals: zero, one or more intervals.
+        """
+        columns = [self.__class__._columns(interval) for interval in intervals]
+
+        if len(columns) == 0:
+            self._set_columns(*self.__class__._columns(Interval()))
+        else:
+            self._set_columns(
+                *_sweep(*(numpy.concatenate(column) for column in zip(*columns)), 1)
+            )
+
+    def _set_columns(self, lowers, uppers, left_closed, right_closed):
+        self._lower_values = lowers
+        self._upper_values = uppers
+        self._left_closed = left_closed
+        self._right_closed = right_closed
+
+    @classmethod
+    def _from_columns(cls, lowers, uppers, left_closed, right_closed):
+        """
+        Create an instance from sorted and disjoint atomic intervals, given as
+        four parallel arrays.
+        """
+        instance = cls.__new__(cls)
+        instance._set_columns(lowers, uppers, left_closed, right_closed)
+        return instance
+
+    @classmethod
+    def _columns(cls, interval):
+        """
+        Return the four parallel arrays corresponding to given interval.
+        """
+        if isinstance(interval, ArrayInterval):
+            return (
+                interval._lower_values,
+                interval._upper_values,
+                interval._left_closed,
+                interval._right_closed,
+            )
+        elif isinstance(interval, Interval):
+            return cls._atomics_to_columns(interval._intervals)
+        else:
+            raise TypeError("Parameters must be Interval instances")
+
+    @classmethod
+    def _atomics_to_columns(cls, atomics):
+        """
+        Convert a list of (non-empty) atomic intervals to four parallel arrays.
+        """
+        lowers = numpy.array([_encode(a.lower) for a in atomics], dtype=float)
+        uppers = numpy.array([_encode(a.upper) for a in atomics], dtype=float)
+        left_closed = numpy.array(
+            [a.left == Bound.CLOSED for a in atomics], dtype=bool
+        ) & (lowers != -numpy.inf)
+        right_closed = numpy.array(
+            [a.right == Bound.CLOSED for a in atomics], dtype=bool
+        ) & (uppers != numpy.inf)
+        return lowers, uppers, left_closed, right_closed
+
+    @property
+    def _intervals(self):
+        return [
+            Atomic(
+                Bound.CLOSED if left else Bound.OPEN,
+                _decode(lower),
+                _decode(upper),
+                Bound.CLOSED if right else Bound.OPEN,
+            )
+            for left, lower, upper, right in zip(
+                self._left_closed.tolist(),
+                self._lower_values.tolist(),
+                self._upper_values.tolist(),
+                self._right_closed.tolist(),
+            )
+        ]
+
+    @_intervals.setter
+    def _intervals(self, atomics):
+        self._set_columns(*self.__class__._atomics_to_columns(atomics))
+
+    # Compact representation of Interval, derived from the arrays
+    @property
+    def _flags(self):
+        if self.empty:
+            return _EMPTY
+        return (
+            (_LEFT_CLOSED if self._left_closed[0] else 0)
+            | (_RIGHT_CLOSED if self._right_closed[-1] else 0)
+            | (0 if self.atomic else _MANY)
+        )
+
+    @property
+    def _lower(self):
+        return self.lower
+
+    @property
+    def _upper(self):
+        return self.upper
+
+    @property
+    def _atomics(self):
+        return self._intervals
+
+    @classmethod
+    def from_atomic(cls, left, lower, upper, right):
+        """
+        Create an ArrayInterval instance containing a single atomic interval.
+
+        :param left: either CLOSED or OPEN.
+        :param lower: value of the lower bound.
+        :param upper: value of the upper bound.
+        :param right: either CLOSED or OPEN.
+        """
+        return cls.from_atomics([(left, lower, upper, right)])
+
+    @classmethod
+    def from_atomics(cls, atomics, *, presorted=False, disjoint=False):
+        """
+        Create an ArrayInterval instance from a collection of atomic intervals.
+
+        Unless told otherwise, atomic intervals are sorted and merged. Contrary to
+        Interval.from_atomics, empty atomic intervals are accepted.
+
+        :param atomics: an iterable of 4-uples (left, lower, upper, right).
+        :param presorted: set to True if atomic intervals are sorted (default is False).
+        :param disjoint: set to True if atomic intervals cannot be merged (default
+            is False).
+        :return: an ArrayInterval instance.
+        """
+        columns = cls._atomics_to_columns([Atomic(*a) for a in atomics])
+
+        if presorted and disjoint:
+            return cls._from_columns(*columns)
+
+        lowers, uppers, left_closed, right_closed = columns
+        keep = (lowers < uppers) | ((lowers == uppers) & left_closed & right_closed)
+        return cls._from_columns(*_sweep(*(column[keep] for column in columns), 1))
+
+    @property
+    def left(self):
+        if self.empty:
+            return Bound.OPEN
+        return Bound.CLOSED if self._left_closed[0] else Bound.OPEN
+
+    @property
+    def lower(self):
+        if self.empty:
+            return inf
+        return _decode(self._lower_values[0].item())
+
+    @property
+    def upper(self):
+        if self.empty:
+            return -inf
+        return _decode(self._upper_values[-1].item())
+
+    @property
+    def right(self):
+        if self.empty:
+            return Bound.OPEN
+        return Bound.CLOSED if self._right_closed[-1] else Bound.OPEN
+
+    @property
+    def empty(self):
+        return len(self._lower_values) == 0
+
+    @property
+    def atomic(self):
+        return len(self._lower_values) <= 1
+
+    def overlaps(self, other):
+        if isinstance(other, Interval):
+            return not (self & other).empty
+        else:
+            raise TypeError("Unsupported type {} for {}".format(type(other), other))
+
+    def contains_many(self, values):
+        array = numpy.asarray(values, dtype=float)
+
+        # Last atomic interval whose lower bound is lower or equal to each value
+        index = numpy.searchsorted(self._lower_values, array, side="right") - 1
+        found = index >= 0
+        index = numpy.where(found, index, 0)
+
+        if self.empty:
+            return numpy.zeros(array.shape, dtype=bool)
+
+        lower, upper = self._lower_values[index], self._upper_values[index]
+        return (
+            found
+            & ((array > lower) | ((array == lower) & self._left_closed[index]))
+            & ((array < upper) | ((array == upper) & self._right_closed[index]))
+        )
+
+    def __len__(self):
+        return len(self._lower_values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            if item.step is not None and item.step < 0:
+                return super().__getitem__(item)
+        else:
+            length = len(self)
+            if not -length <= item < length:
+                raise IndexError("ArrayInterval index out of range")
+            item = item % length
+            item = slice(item, item + 1)
+
+        return self.__class__._from_columns(
+            self._lower_values[item],
+            self._upper_values[item],
+            self._left_closed[item],
+            self._right_closed[item],
+        )
+
+    def __and__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        columns = zip(self.__class__._columns(self), self.__class__._columns(other))
+        return self.__class__._from_columns(
+            *_sweep(*(numpy.concatenate(column) for column in columns), 2)
+        )
+
+    def __or__(self, other):
+        if isinstance(other, Interval):
+            return self.__class__(self, other)
+        else:
+            return NotImplemented
+
+    def __contains__(self, item):
+        if isinstance(item, Interval):
+            return (
+                self.__class__._from_columns(*self.__class__._columns(item)) - self
+            ).empty
+        else:
+            return bool(self.contains_many(_encode(item)))
+
+    def __invert__(self):
+        return self.__class__._from_columns(
+            *_complement(*self.__class__._columns(self))
+        )
+
+    def __sub__(self, other):
+        if isinstance(other, Interval):
+            complement = self.__class__._from_columns(
+                *_complement(*self.__class__._columns(other))
+            )
+            return self & complement
+        else:
+            return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, ArrayInterval):
+            return all(
+                numpy.array_equal(a, b)
+                for a, b in zip(
+                    self.__class__._columns(self), self.__class__._columns(other)
+                )
+            )
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __reduce__(self):
+        # Compact representation cannot be restored, columns are pickled instead
+        return self.__class__._from_columns, self.__class__._columns(self)
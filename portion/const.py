@@ -22,6 +22,42 @@ class Bound(enum.Enum):
         return self.name
 
 
+class Relation(enum.Enum):
+    """
+    Allen's relations between two intervals, from the point of view of the
+    first one (e.g., BEFORE means that the first interval is before the second
+    one). MEETS and MET_BY hold for disjoint intervals whose union is atomic.
+    """
+
+    BEFORE = "before"
+    MEETS = "meets"
+    OVERLAPS = "overlaps"
+    STARTS = "starts"
+    DURING = "during"
+    FINISHES = "finishes"
+    EQUALS = "equals"
+    FINISHED_BY = "finished by"
+    CONTAINS = "contains"
+    STARTED_BY = "started by"
+    OVERLAPPED_BY = "overlapped by"
+    MET_BY = "met by"
+    AFTER = "after"
+
+    def __invert__(self):
+        return _converses[self]
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return self.name
+
+
+_converses = {
+    relation: converse for relation, converse in zip(Relation, reversed(list(Relation)))
+}
+
+
 class _Singleton:
     __instance = None
 
@@ -0,0 +1,193 @@
+from operator import itemgetter
+
+from .const import Bound
+from .interval import Atomic, Interval, _cut_key
+
+
+class Expression:
+    """
+    This class represents a deferred set-algebra expression on intervals.
+
+    An expression records the operators (|, &, - and ~) applied on intervals
+    without computing any intermediate interval. It is evaluated at once with
+    a single sweep over the bounds of all involved intervals.
+
+    Expressions are created with P.lazy(...).
+    """
+
+    __slots__ = ("_operator", "_operands")
+
+    def __init__(self, operator, *operands):
+        """
+        Create an expression. Use P.lazy(...) instead.
+
+        :param operator: None for an interval, or one of "|", "&", "-" and "~".
+        :param operands: the operands of the operator.
+        """
+        self._operator = operator
+        self._operands = operands
+
+    @classmethod
+    def _wrap(cls, item):
+        """
+        Return given item as an expression, or None if it is not supported.
+        """
+        if isinstance(item, Expression):
+            return item
+        elif isinstance(item, Interval):
+            return cls(None, item)
+        return None
+
+    def _leaves(self):
+        """
+        Return the intervals involved in current expression, from left to right.
+        """
+        if self._operator is None:
+            return [self._operands[0]]
+        return [leaf for operand in self._operands for leaf in operand._leaves()]
+
+    def _compile(self, indexes):
+        """
+        Convert current expression to a function that tests whether a part of
+        the domain is in the expression, given the number of atomic intervals of
+        each involved interval that cover this part.
+
+        :param indexes: a dict that maps the id of each interval to its position.
+        :return: a function.
+        """
+        if self._operator is None:
+            index = indexes[id(self._operands[0])]
+            return lambda coverage: coverage[index] > 0
+        elif self._operator == "~":
+            operand = self._operands[0]._compile(indexes)
+            return lambda coverage: not operand(coverage)
+
+        first = self._operands[0]._compile(indexes)
+        second = self._operands[1]._compile(indexes)
+        if self._operator == "|":
+            return lambda coverage: first(coverage) or second(coverage)
+        elif self._operator == "&":
+            return lambda coverage: first(coverage) and second(coverage)
+        else:
+            return lambda coverage: first(coverage) and not second(coverage)
+
+    def evaluate(self, *, klass=None):
+        """
+        Compute the interval corresponding to current expression.
+
+        :param klass: class to use for the resulting interval (default to the
+            class of the leftmost interval of the expression).
+        :return: an interval.
+        """
+        leaves = self._leaves()
+        klass = leaves[0].__class__ if klass is None else klass
+
+        # Each interval is swept once, even if it appears many times
+        indexes = {}
+        events = []
+        for leaf in leaves:
+            if id(leaf) in indexes:
+                continue
+            index = indexes[id(leaf)] = len(indexes)
+
+            # A cut (value, side) is just before (0) or just after (1) value
+            for left, lower, upper, right in leaf._intervals:
+                events.append((lower, 0 if left is Bound.CLOSED else 1, index, 1))
+                events.append((upper, 1 if right is Bound.CLOSED else 0, index, -1))
+
+        if klass._bound_key is None:
+            events.sort(key=itemgetter(0, 1))
+        else:
+            key = _cut_key(klass)
+            events.sort(key=lambda event: key(event[0], event[1]))
+        predicate = self._compile(indexes)
+        coverage = [0] * len(indexes)
+
+        atomics = []
+        start = (-klass._inf, 1)
+        included = predicate(coverage)
+
+        position, length = 0, len(events)
+        while position < length:
+            cut = events[position][:2]
+            # Apply all the changes occurring on this cut
+            while position < length and events[position][:2] == cut:
+                _, _, index, delta = events[position]
+                coverage[index] = coverage[index] + delta
+                position = position + 1
+
+            if predicate(coverage) != included:
+                included = not included
+                if included:
+                    start = cut
+                elif start < cut:
+                    atomics.append(_atomic(start, cut))
+
+        if included and start < (klass._inf, 0):
+            atomics.append(_atomic(start, (klass._inf, 0)))
+
+        return klass._from_sorted_atomics(atomics)
+
+    def __or__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("|", self, other)
+
+    def __ror__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("|", other, self)
+
+    def __and__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("&", self, other)
+
+    def __rand__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("&", other, self)
+
+    def __sub__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("-", self, other)
+
+    def __rsub__(self, other):
+        other = Expression._wrap(other)
+        return NotImplemented if other is None else Expression("-", other, self)
+
+    def __invert__(self):
+        return Expression("~", self)
+
+    def __repr__(self):
+        if self._operator is None:
+            return "lazy({!r})".format(self._operands[0])
+        elif self._operator == "~":
+            return "~{!r}".format(self._operands[0])
+        return "({!r} {} {!r})".format(
+            self._operands[0], self._operator, self._operands[1]
+        )
+
+
+def _atomic(start, end):
+    """
+    Convert a pair of cuts to an atomic interval.
+    """
+    return Atomic(
+        Bound.CLOSED if start[1] == 0 else Bound.OPEN,
+        start[0],
+        end[0],
+        Bound.CLOSED if end[1] == 1 else Bound.OPEN,
+    )
+
+
+def lazy(interval):
+    """
+    Create a deferred expression from an interval.
+
+    Operators |, & and - (with intervals or expressions) and ~ on the resulting
+    expression are recorded instead of being computed. The expression is
+    computed with its evaluate method.
+
+    :param interval: an interval.
+    :return: an expression.
+    """
+    if not isinstance(interval, Interval):
+        raise TypeError("Parameter must be an Interval instance")
+    return Expression(None, interval)
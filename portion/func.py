@@ -1,7 +1,10 @@
+import heapq
+import math
 import operator
 
 from functools import partial
-from .interval import Interval
+from itertools import count
+from .interval import Interval, _relation
 from .const import Bound, inf
 
 
@@ -66,12 +69,23 @@ def singleton(value, *, klass=Interval):
 
 def empty(*, klass=Interval):
     """
-    Create an empty interval.
+    Return an empty interval.
+
+    Empty intervals are immutable, hence a single instance is shared per class.
 
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass()
+    return klass._empty()
+
+
+def _infinite(interval, value, reverse):
+    """
+    Test whether given value is the infinity an iteration would start from.
+    """
+    if not reverse:
+        return value == -inf or value == -interval._inf
+    return value == inf or value == interval._inf
 
 
 def iterate(interval, step, *, base=None, reverse=False):
@@ -126,7 +140,7 @@ def iterate(interval, step, *, base=None, reverse=False):
     step = step if callable(step) else partial(operator.add, step)
 
     value = base(interval.lower if not reverse else interval.upper)
-    if (value == -inf and not reverse) or (value == inf and reverse):
+    if _infinite(interval, value, reverse):
         raise ValueError("Cannot start iteration with infinity.")
 
     for i in interval if not reverse else reversed(interval):
@@ -138,3 +152,222 @@ def iterate(interval, step, *, base=None, reverse=False):
         while include(value, i):
             yield value
             value = step(value)
+
+
+def iterate_chunks(interval, step, *, base=None, reverse=False, chunk_size=None):
+    """
+    Iterate on the (discrete) values of given interval, by chunks.
+
+    This function is similar to iterate (see its documentation for the meaning
+    of the parameters), except that it returns a (lazy) iterator over chunks of
+    values rather than over values, and that step must be a number. Each chunk
+    contains values of a single atomic interval, computed as start + i * step.
+    Chunks are range objects if values and step are integers, and numpy arrays
+    otherwise (or lists if numpy is not installed).
+
+    If chunk_size is set, chunks contain at most chunk_size values. This is
+    required for unbounded intervals.
+
+    :param interval: an interval.
+    :param step: step between values.
+    :param base: a callable that accepts a bound and returns an initial value.
+    :param reverse: set to True for descending order.
+    :param chunk_size: maximal number of values per chunk (default is None).
+    :return: a lazy iterator.
+    """
+    if callable(step):
+        raise TypeError("Step must be a number.")
+    elif step == 0 or (step > 0) == reverse:
+        raise ValueError("Step must be positive, or negative if reverse is True.")
+    elif chunk_size is not None and chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+
+    if base is None:
+
+        def base(x):
+            return x
+
+    value = base(interval.lower if not reverse else interval.upper)
+    if _infinite(interval, value, reverse):
+        raise ValueError("Cannot start iteration with infinity.")
+
+    for i in interval.atomics() if not reverse else reversed(interval.atomics()):
+        if not reverse:
+            start, start_open = i.lower, i.left is Bound.OPEN
+            end, end_open = i.upper, i.right is Bound.OPEN
+        else:
+            start, start_open = i.upper, i.right is Bound.OPEN
+            end, end_open = i.lower, i.left is Bound.OPEN
+
+        def before_start(v):
+            difference = (v - start) / step
+            return difference < 0 or (start_open and difference == 0)
+
+        def before_end(v):
+            difference = (end - v) / step
+            return difference > 0 or (not end_open and difference == 0)
+
+        # First value, aligned on base
+        first = base(start)
+        if before_start(first):
+            count = _steps(start - first, step, math.ceil)
+            while before_start(first + count * step):
+                count = count + 1
+            first = first + count * step
+
+        # Number of values
+        if _infinite(interval, end, not reverse):
+            if chunk_size is None:
+                raise ValueError("Chunk size must be set for unbounded intervals.")
+            length = None
+        else:
+            length = max(0, _steps(end - first, step, math.floor) + 1)
+            while length > 0 and not before_end(first + (length - 1) * step):
+                length = length - 1
+            while before_end(first + length * step):
+                length = length + 1
+
+        position = 0
+        while length is None or position < length:
+            size = length - position if length is not None else chunk_size
+            size = size if chunk_size is None else min(size, chunk_size)
+            yield _chunk(first + position * step, step, size)
+            position = position + size
+
+
+def _steps(distance, step, rounding):
+    """
+    Return the number of steps to cover given distance, rounded with given
+    function (math.floor or math.ceil).
+    """
+    if isinstance(distance, int) and isinstance(step, int):
+        return distance // step if rounding is math.floor else -(-distance // step)
+    return int(rounding(distance / step))
+
+
+def _chunk(first, step, size):
+    """
+    Return a chunk of size values, starting from first and separated by step.
+    """
+    if isinstance(first, int) and isinstance(step, int):
+        return range(first, first + size * step, step)
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return [first + i * step for i in range(size)]
+    return first + step * numpy.arange(size)
+
+
+def relations(intervals, other):
+    """
+    Return Allen's relations between each of given intervals and another one.
+
+    This is equivalent to calling relation(other) on each interval, except that
+    the bounds of the other interval are looked up only once.
+
+    :param intervals: an iterable of non-empty intervals.
+    :param other: a non-empty interval.
+    :return: a list of Relation.
+    """
+    if not isinstance(other, Interval):
+        raise TypeError("Unsupported type {} for {}".format(type(other), other))
+    elif other.empty:
+        raise ValueError("Relations are not defined for empty intervals.")
+
+    other_first, other_last = other._intervals[0], other._intervals[-1]
+    result = []
+
+    for interval in intervals:
+        if not isinstance(interval, Interval):
+            raise TypeError(
+                "Unsupported type {} for {}".format(type(interval), interval)
+            )
+        elif interval.empty:
+            raise ValueError("Relations are not defined for empty intervals.")
+
+        atomics = interval._intervals
+        result.append(
+            _relation(
+                atomics[0],
+                atomics[-1],
+                other_first,
+                other_last,
+                interval.__class__._mergeable,
+            )
+        )
+    return result
+
+
+def _tag(items, side, presorted):
+    """
+    Convert (interval, payload) pairs to sweep entries (start, side, index, item)
+    where start is the position of the lower bound of the interval. Empty
+    intervals are ignored.
+    """
+    previous = None
+    for index, item in enumerate(items):
+        interval = item[0]
+        if not isinstance(interval, Interval):
+            raise TypeError(
+                "Unsupported type {} for {}".format(type(interval), interval)
+            )
+        elif interval.empty:
+            continue
+
+        start = (interval.lower, 0 if interval.left is Bound.CLOSED else 1)
+        if presorted and previous is not None and start < previous:
+            raise ValueError("Intervals must be sorted by lower bound.")
+        previous = start
+        yield start, side, index, item
+
+
+def overlap_join(left, right, *, intersection=False, presorted=False):
+    """
+    Find all the pairs of overlapping intervals from two collections.
+
+    This function accepts two iterables of (interval, payload) pairs, and
+    (lazily) returns the pairs (left item, right item) whose intervals
+    overlap. The intervals of both collections are swept by increasing lower
+    bound, while keeping the ones that are not yet over in an active set.
+    If intersection is True, the intersection of both intervals is returned as
+    a third element.
+
+    If both collections are already sorted by lower bound (e.g., when they are
+    streamed from a sorted source), set presorted to True to avoid sorting them
+    first. Pairs are then returned as soon as they are found.
+
+    :param left: an iterable of (interval, payload) pairs.
+    :param right: an iterable of (interval, payload) pairs.
+    :param intersection: set to True to also return the intersection.
+    :param presorted: set to True if collections are sorted by lower bound.
+    :return: a lazy iterator of (left item, right item) pairs, or of (left item,
+        right item, intersection) 3-uples.
+    """
+    entries = [_tag(left, 0, presorted), _tag(right, 1, presorted)]
+    if not presorted:
+        entries = [sorted(side) for side in entries]
+
+    # Active items per side, in a heap ordered by the position of upper bounds
+    active = ([], [])
+    counter = count()
+
+    for start, side, _, item in heapq.merge(*entries):
+        interval = item[0]
+        others = active[1 - side]
+
+        # Discard items that end before current one starts
+        while len(others) > 0 and others[0][0] <= start:
+            heapq.heappop(others)
+
+        for _, _, other_item in others:
+            other = other_item[0]
+            if (interval.atomic and other.atomic) or interval.overlaps(other):
+                pair = (item, other_item) if side == 0 else (other_item, item)
+                if intersection:
+                    yield pair + (interval & other,)
+                else:
+                    yield pair
+
+        end = (interval.upper, 1 if interval.right is Bound.CLOSED else 0)
+        heapq.heappush(active[side], (end, next(counter), item))
@@ -1,11 +1,34 @@
 import warnings
+import weakref
 
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
-from .const import Bound, inf
+from collections.abc import Sequence
+from .const import Bound, Relation, inf
 
 
 Atomic = namedtuple("Atomic", ["left", "lower", "upper", "right"])
 
+# Negative infinity, to avoid creating it each time it is needed
+_ninf = -inf
+
+# Shared empty instances, per class
+_empties = {}
+
+# Interned instances, per class and atomic intervals
+_interned = weakref.WeakValueDictionary()
+
+# Flags of the compact representation of intervals (see Interval._intervals)
+_LEFT_CLOSED = 1
+_RIGHT_CLOSED = 2
+_MANY = 4
+_EMPTY = 8
+_bounds = (Bound.OPEN, Bound.CLOSED)
+
+# Keys of infinities, when bounds are encoded (see Interval._bound_key)
+_key_pinf = float("inf")
+_key_ninf = float("-inf")
+
 
 def mergeable(a, b):
     """
@@ -23,6 +46,391 @@ def mergeable(a, b):
     return Interval._mergeable(a, b)
 
 
+def _union(current, successor):
+    """
+    Return the union of two mergeable atomic intervals.
+
+    :param current: an atomic interval.
+    :param successor: an atomic interval, mergeable with the first one.
+    :return: an atomic interval.
+    """
+    if current.lower == successor.lower:
+        lower = current.lower
+        left = current.left if current.left == Bound.CLOSED else successor.left
+    else:
+        lower = min(current.lower, successor.lower)
+        left = current.left if lower == current.lower else successor.left
+
+    if current.upper == successor.upper:
+        upper = current.upper
+        right = current.right if current.right == Bound.CLOSED else successor.right
+    else:
+        upper = max(current.upper, successor.upper)
+        right = current.right if upper == current.upper else successor.right
+
+    return Atomic(left, lower, upper, right)
+
+
+def _difference(atomics, others):
+    """
+    Subtract a list of atomic intervals from another one, in a single pass.
+
+    :param atomics: a sorted list of pairwise disjoint atomic intervals.
+    :param others: a sorted list of pairwise disjoint atomic intervals.
+    :return: a sorted list of pairwise disjoint atomic intervals.
+    """
+    difference = []
+    position, length = 0, len(others)
+
+    for left, lower, upper, right in atomics:
+        # Skip atomic intervals that end before current one
+        while position < length:
+            other = others[position]
+            if other.upper < lower or (
+                other.upper == lower
+                and (other.right is Bound.OPEN or left is Bound.OPEN)
+            ):
+                position = position + 1
+            else:
+                break
+
+        exhausted = False
+        while position < length:
+            other = others[position]
+            if other.lower > upper or (
+                other.lower == upper
+                and (other.left is Bound.OPEN or right is Bound.OPEN)
+            ):
+                # Other starts after current atomic interval
+                break
+
+            # Keep what precedes other
+            if lower < other.lower or (
+                lower == other.lower
+                and left is Bound.CLOSED
+                and other.left is Bound.OPEN
+            ):
+                difference.append(Atomic(left, lower, other.lower, ~other.left))
+
+            # Continue with what follows other, if anything
+            if other.upper < upper or (
+                other.upper == upper
+                and right is Bound.CLOSED
+                and other.right is Bound.OPEN
+            ):
+                left, lower = ~other.right, other.upper
+                position = position + 1
+            else:
+                # Other may overlap next atomic interval
+                exhausted = True
+                break
+
+        if not exhausted:
+            difference.append(Atomic(left, lower, upper, right))
+
+    return difference
+
+
+def _start(atomic):
+    """
+    Sort key for atomic intervals, by lower bound and closed ones first.
+    """
+    return (atomic.lower, atomic.left is Bound.OPEN)
+
+
+def _cut_key(cls):
+    """
+    Return a function that maps a cut (value, side), where side is 0 if the cut
+    is just before value and 1 if it is just after, to an order-preserving key.
+    If given class defines a _bound_key function, the side is folded into the
+    (integer) key of the value. Otherwise, keys are (value, side) pairs.
+
+    :param cls: a subclass of Interval.
+    :return: a function.
+    """
+    encode = cls._bound_key
+    if encode is None:
+        return lambda value, side: (value, side)
+
+    positive, negative = cls._inf, -cls._inf
+
+    def key(value, side):
+        # Compare by equality, as float infinities are not singletons
+        if value == positive or value == negative:
+            return _key_pinf if value == positive else _key_ninf
+        return 2 * encode(value) + side
+
+    return key
+
+
+def _sort_key(cls):
+    """
+    Return a sort key for the atomic intervals of given class, by lower bound
+    and closed ones first.
+
+    :param cls: a subclass of Interval.
+    :return: a function.
+    """
+    encode = cls._bound_key
+    if encode is None:
+        return _start
+
+    # Lower bounds cannot be positive infinity
+    negative = -cls._inf
+    return lambda atomic: (
+        _key_ninf
+        if atomic.lower == negative
+        else 2 * encode(atomic.lower) + (atomic.left is Bound.OPEN)
+    )
+
+
+def _before(a, b):
+    """
+    Test whether an atomic interval ends before another one starts.
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if a and b do not overlap and a precedes b, False otherwise.
+    """
+    if a.right is Bound.OPEN or b.left is Bound.OPEN:
+        return a.upper <= b.lower
+    return a.upper < b.lower
+
+
+def _ends_first(a, b):
+    """
+    Test whether an atomic interval does not extend further than another one.
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if a ends before or with b, False otherwise.
+    """
+    if a.right is Bound.OPEN or b.right is Bound.CLOSED:
+        return a.upper <= b.upper
+    return a.upper < b.upper
+
+
+def _includes(a, b):
+    """
+    Test whether an atomic interval contains another one.
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if b is a subset of a, False otherwise.
+    """
+    left = b.lower > a.lower or (
+        b.lower == a.lower and (b.left is a.left or a.left is Bound.CLOSED)
+    )
+    right = b.upper < a.upper or (
+        b.upper == a.upper and (b.right is a.right or a.right is Bound.CLOSED)
+    )
+    return left and right
+
+
+def _gallop(bounds, value, start):
+    """
+    Find the first position, from start, of a sorted list of bounds whose bound
+    is not lower than given value. The list is searched with an exponential
+    search followed by a binary search, so that the cost is logarithmic in the
+    distance between start and the resulting position.
+
+    :param bounds: a sorted list of bounds.
+    :param value: a value.
+    :param start: position to start from.
+    :return: a position.
+    """
+    length = len(bounds)
+    end, step = start, 1
+
+    while end < length and bounds[end] < value:
+        start, end, step = end + 1, end + step, step * 2
+    return bisect_left(bounds, value, start, min(end, length))
+
+
+def _skip(uppers, position, atomic):
+    """
+    Return the position of the next atomic interval that may not end before
+    given atomic interval, from given position. If the upper bounds of the
+    atomic intervals are not provided, next position is returned.
+
+    :param uppers: optional sorted list of upper bounds of atomic intervals.
+    :param position: position of an atomic interval that ends before atomic.
+    :param atomic: an atomic interval.
+    :return: a position.
+    """
+    if uppers is None:
+        return position + 1
+    return _gallop(uppers, atomic.lower, position + 1)
+
+
+def _intersection(atomics, others, uppers=None, other_uppers=None):
+    """
+    Intersect two lists of atomic intervals, in a single pass.
+
+    If the upper bounds of (the largest) one of these lists are provided, its
+    atomic intervals that end before the ones of the other list are skipped
+    using a galloping search instead of a linear scan.
+
+    :param atomics: a sorted list of pairwise disjoint atomic intervals.
+    :param others: a sorted list of pairwise disjoint atomic intervals.
+    :param uppers: optional list of the upper bounds of atomics.
+    :param other_uppers: optional list of the upper bounds of others.
+    :return: a sorted list of pairwise disjoint atomic intervals.
+    """
+    intersection = []
+    i, i_length = 0, len(atomics)
+    o, o_length = 0, len(others)
+
+    while i < i_length and o < o_length:
+        current, other = atomics[i], others[o]
+        if _before(current, other):
+            i = _skip(uppers, i, other)
+        elif _before(other, current):
+            o = _skip(other_uppers, o, current)
+        else:
+            if current.lower == other.lower:
+                lower = current.lower
+                left = current.left if current.left is Bound.OPEN else other.left
+            elif current.lower > other.lower:
+                left, lower = current.left, current.lower
+            else:
+                left, lower = other.left, other.lower
+
+            if _ends_first(current, other):
+                # Other can still intersect next atomic interval
+                intersection.append(Atomic(left, lower, current.upper, current.right))
+                i = i + 1
+            else:
+                # Current can still intersect next other atomic interval
+                intersection.append(Atomic(left, lower, other.upper, other.right))
+                o = o + 1
+
+    return intersection
+
+
+def _overlap(atomics, others, uppers=None, other_uppers=None):
+    """
+    Test whether two lists of atomic intervals overlap.
+
+    Upper bounds of these lists can be provided to skip atomic intervals using
+    a galloping search, see _intersection.
+
+    :param atomics: a sorted list of pairwise disjoint atomic intervals.
+    :param others: a sorted list of pairwise disjoint atomic intervals.
+    :param uppers: optional list of the upper bounds of atomics.
+    :param other_uppers: optional list of the upper bounds of others.
+    :return: True if at least one pair of atomic intervals overlap.
+    """
+    i, i_length = 0, len(atomics)
+    o, o_length = 0, len(others)
+
+    while i < i_length and o < o_length:
+        current, other = atomics[i], others[o]
+        if _before(current, other):
+            i = _skip(uppers, i, other)
+        elif _before(other, current):
+            o = _skip(other_uppers, o, current)
+        else:
+            return True
+    return False
+
+
+def _compare(value, side, other_value, other_side):
+    """
+    Compare two positions in the domain, each position being given by a value
+    and a side (0 if the position is just before the value, 1 if just after).
+
+    :return: -1, 0 or 1 if the first position is respectively lower than,
+        equal to, or greater than the second one.
+    """
+    if value == other_value:
+        return side - other_side
+    return -1 if value < other_value else 1
+
+
+# Allen's relation of overlapping intervals, given how their starts and
+# their ends compare.
+_overlapping_relations = {
+    (0, 0): Relation.EQUALS,
+    (0, -1): Relation.STARTS,
+    (0, 1): Relation.STARTED_BY,
+    (1, 0): Relation.FINISHES,
+    (-1, 0): Relation.FINISHED_BY,
+    (1, -1): Relation.DURING,
+    (-1, 1): Relation.CONTAINS,
+    (-1, -1): Relation.OVERLAPS,
+    (1, 1): Relation.OVERLAPPED_BY,
+}
+
+
+def _relation(first, last, other_first, other_last, mergeable):
+    """
+    Return Allen's relation between two non-empty intervals, given their first
+    and last atomic intervals. Only the enclosures of both intervals are
+    compared, except for MEETS and MET_BY that rely on given mergeable function.
+
+    :param first: first atomic interval of the first interval.
+    :param last: last atomic interval of the first interval.
+    :param other_first: first atomic interval of the second interval.
+    :param other_last: last atomic interval of the second interval.
+    :param mergeable: a function that tests whether two atomic intervals can be
+        merged.
+    :return: a Relation.
+    """
+    start = 0 if first.left is Bound.CLOSED else 1
+    end = 1 if last.right is Bound.CLOSED else 0
+    other_start = 0 if other_first.left is Bound.CLOSED else 1
+    other_end = 1 if other_last.right is Bound.CLOSED else 0
+
+    if _compare(last.upper, end, other_first.lower, other_start) <= 0:
+        return Relation.MEETS if mergeable(last, other_first) else Relation.BEFORE
+    elif _compare(other_last.upper, other_end, first.lower, start) <= 0:
+        return Relation.MET_BY if mergeable(other_last, first) else Relation.AFTER
+
+    return _overlapping_relations[
+        (
+            _compare(first.lower, start, other_first.lower, other_start),
+            _compare(last.upper, end, other_last.upper, other_end),
+        )
+    ]
+
+
+class AtomicView(Sequence):
+    """
+    A read-only sequence of the atomic intervals of an interval.
+
+    Items are the (left, lower, upper, right) 4-uples the interval is made of,
+    and are neither copied nor converted to Interval instances.
+    """
+
+    __slots__ = ("_atomics",)
+
+    def __init__(self, atomics):
+        self._atomics = atomics
+
+    def __len__(self):
+        return len(self._atomics)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return AtomicView(self._atomics[item])
+        return self._atomics[item]
+
+    def __iter__(self):
+        return iter(self._atomics)
+
+    def __reversed__(self):
+        return reversed(self._atomics)
+
+    def __eq__(self, other):
+        if isinstance(other, AtomicView):
+            return self._atomics == other._atomics
+        return NotImplemented
+
+    def __repr__(self):
+        return "AtomicView({!r})".format(self._atomics)
+
+
 class Interval:
     """
     This class represents an interval.
@@ -32,68 +440,65 @@ class Interval:
     instances to __init__.
     """
 
-    __slots__ = ("_intervals",)
+    __slots__ = ("_flags", "_lower", "_upper", "_atomics", "_cache", "__weakref__")
     __match_args__ = ("left", "lower", "upper", "right")
 
+    # Positive infinity (negative infinity is -_inf)
+    _inf = inf
+
+    # Optional order-preserving function that maps (finite) bounds to integers,
+    # used to sort bounds that are expensive to compare (e.g., datetimes)
+    _bound_key = None
+
     def __init__(self, *intervals):
         """
         Create a disjunction of zero, one or more intervals.
 
         :param intervals: zero, one or more intervals.
         """
-        self._intervals = list()
+        if len(intervals) == 0:
+            self._flags = _EMPTY
+            return
+
+        atomics = []
 
         for interval in intervals:
             if isinstance(interval, Interval):
-                if not interval.empty:
-                    self._intervals.extend(interval._intervals)
+                atomics.extend(self.__class__._atomics_of(interval))
             else:
                 raise TypeError("Parameters must be Interval instances")
 
-        if len(self._intervals) > 0:
+        if len(intervals) > 1:
             # Sort intervals by lower bound, closed first.
-            self._intervals.sort(key=lambda i: (i.lower, i.left is Bound.OPEN))
-
-            i = 0
-            # Try to merge consecutive intervals
-            while i < len(self._intervals) - 1:
-                current = self._intervals[i]
-                successor = self._intervals[i + 1]
-
-                if self.__class__._mergeable(current, successor):
-                    if current.lower == successor.lower:
-                        lower = current.lower
-                        left = (
-                            current.left
-                            if current.left == Bound.CLOSED
-                            else successor.left
-                        )
-
-                    else:
-                        lower = min(current.lower, successor.lower)
-                        left = (
-                            current.left if lower == current.lower else successor.left
-                        )
-
-                    if current.upper == successor.upper:
-                        upper = current.upper
-                        right = (
-                            current.right
-                            if current.right == Bound.CLOSED
-                            else successor.right
-                        )
-                    else:
-                        upper = max(current.upper, successor.upper)
-                        right = (
-                            current.right if upper == current.upper else successor.right
-                        )
-
-                    union = Atomic(left, lower, upper, right)
-                    self._intervals.pop(i)  # pop current
-                    self._intervals.pop(i)  # pop successor
-                    self._intervals.insert(i, union)
-                else:
-                    i = i + 1
+            atomics.sort(key=_sort_key(self.__class__))
+
+        self._intervals = self.__class__._merge_atomics(atomics)
+
+    @classmethod
+    def from_atomics(cls, atomics, *, presorted=False, disjoint=False):
+        """
+        Create an Interval instance from a collection of atomic intervals.
+
+        Atomic intervals are 4-uples (left, lower, upper, right) that are expected
+        to be non-empty and normalized, such as the ones that compose an existing
+        interval. Unless told otherwise, they are sorted and merged. If the caller
+        guarantees that they are sorted by lower bound (presorted) and pairwise
+        non-mergeable (disjoint), they are used as-is.
+
+        :param atomics: an iterable of 4-uples (left, lower, upper, right).
+        :param presorted: set to True if atomic intervals are sorted (default is False).
+        :param disjoint: set to True if atomic intervals cannot be merged (default
+            is False).
+        :return: an Interval instance.
+        """
+        atomics = [a if type(a) is Atomic else Atomic(*a) for a in atomics]
+
+        if not presorted:
+            atomics.sort(key=_sort_key(cls))
+
+        instance = cls()
+        instance._intervals = atomics if disjoint else cls._merge_atomics(atomics)
+        return instance
 
     @classmethod
     def from_atomic(cls, left, lower, upper, right):
@@ -105,17 +510,149 @@ class Interval:
         :param upper: value of the upper bound.
         :param right: either CLOSED or OPEN.
         """
-        left = left if lower not in [inf, -inf] else Bound.OPEN
-        right = right if upper not in [inf, -inf] else Bound.OPEN
+        left = Bound.OPEN if lower is inf or lower is _ninf else left
+        right = Bound.OPEN if upper is inf or upper is _ninf else right
 
         instance = cls()
-        # Check for non-emptiness (otherwise keep instance._intervals = [])
+        # Check for non-emptiness (otherwise keep instance empty)
         if lower < upper or (
             lower == upper and left == Bound.CLOSED and right == Bound.CLOSED
         ):
-            instance._intervals = [Atomic(left, lower, upper, right)]
+            instance._set_atomic(left, lower, upper, right)
         return instance
 
+    @classmethod
+    def union_all(cls, intervals):
+        """
+        Compute the union of many intervals at once.
+
+        This is equivalent to folding intervals with |, but atomic intervals are
+        sorted and merged only once.
+
+        :param intervals: an iterable of intervals.
+        :return: an Interval instance.
+        """
+        atomics = []
+        for interval in intervals:
+            if isinstance(interval, Interval):
+                atomics.extend(cls._atomics_of(interval))
+            else:
+                raise TypeError("Parameters must be Interval instances")
+
+        # Sorting is linear-logarithmic in the number of (sorted) inputs
+        atomics.sort(key=_sort_key(cls))
+        return cls.from_atomics(atomics, presorted=True)
+
+    @classmethod
+    def intersection_all(cls, intervals):
+        """
+        Compute the intersection of many intervals at once.
+
+        This is equivalent to folding intervals with &, but atomic intervals are
+        processed in a single sweep that counts how many intervals cover each part
+        of the domain. The intersection of no interval is the whole domain.
+
+        :param intervals: an iterable of intervals.
+        :return: an Interval instance.
+        """
+        events = []
+        count = 0
+
+        for interval in intervals:
+            if not isinstance(interval, Interval):
+                raise TypeError("Parameters must be Interval instances")
+            elif interval.empty:
+                return cls._empty()
+
+            count = count + 1
+            for left, lower, upper, right in interval._intervals:
+                # (value, side, kind) where side is True if the cut is after value,
+                # and ends (kind 0) precede starts (kind 1) on the same cut.
+                events.append((lower, left is Bound.OPEN, 1))
+                events.append((upper, right is Bound.CLOSED, 0))
+
+        if count == 0:
+            return cls.from_atomic(Bound.OPEN, -cls._inf, cls._inf, Bound.OPEN)
+
+        if cls._bound_key is None:
+            events.sort()
+        else:
+            key = _cut_key(cls)
+            events.sort(key=lambda event: (key(event[0], event[1]), event[2]))
+
+        intersection = []
+        covering = 0
+
+        for value, side, kind in events:
+            if kind == 1:
+                covering = covering + 1
+                if covering == count:
+                    left, lower = (Bound.OPEN if side else Bound.CLOSED), value
+            else:
+                if covering == count:
+                    right = Bound.CLOSED if side else Bound.OPEN
+                    intersection.append(Atomic(left, lower, value, right))
+                covering = covering - 1
+
+        return cls._from_sorted_atomics(intersection)
+
+    @classmethod
+    def _empty(cls):
+        """
+        Return an empty interval that is shared by all callers.
+
+        :return: an empty Interval instance.
+        """
+        try:
+            return _empties[cls]
+        except KeyError:
+            instance = _empties[cls] = cls()
+            return instance
+
+    @classmethod
+    def _atomics_of(cls, interval):
+        """
+        Return the atomic intervals of given interval, normalized with from_atomic
+        if the interval is an instance of another class and from_atomic is
+        overridden (e.g. for discrete intervals).
+
+        :param interval: an interval.
+        :return: a list of atomic intervals.
+        """
+        if (
+            isinstance(interval, cls)
+            or cls.from_atomic.__func__ is Interval.from_atomic.__func__
+        ):
+            return interval._intervals
+
+        normalized = []
+        for atomic in interval._intervals:
+            normalized.extend(cls.from_atomic(*atomic)._intervals)
+        return normalized
+
+    @classmethod
+    def _from_sorted_atomics(cls, atomics):
+        """
+        Create an Interval instance from sorted and disjoint atomic intervals
+        that are computed by set operations.
+
+        These atomic intervals are already normalized, unless from_atomic is
+        overridden (e.g. for discrete intervals). In that case, each of them is
+        normalized with from_atomic before being merged.
+
+        :param atomics: a sorted list of pairwise disjoint atomic intervals.
+        :return: an Interval instance.
+        """
+        if len(atomics) == 0:
+            return cls._empty()
+        elif cls.from_atomic.__func__ is Interval.from_atomic.__func__:
+            return cls.from_atomics(atomics, presorted=True, disjoint=True)
+
+        normalized = []
+        for atomic in atomics:
+            normalized.extend(cls.from_atomic(*atomic)._intervals)
+        return cls.from_atomics(normalized, presorted=True)
+
     @classmethod
     def _mergeable(cls, a, b):
         """
@@ -136,48 +673,351 @@ class Interval:
 
         return first.upper > second.lower
 
+    @classmethod
+    def _merge_atomics(cls, atomics):
+        """
+        Merge consecutive atomic intervals in a single pass.
+
+        :param atomics: a list of atomic intervals sorted by lower bound.
+        :return: a list of pairwise non-mergeable atomic intervals.
+        """
+        merged = []
+        mergeable = cls._mergeable
+        current = None
+
+        for successor in atomics:
+            if current is None:
+                current = successor
+            elif mergeable(current, successor):
+                current = _union(current, successor)
+            else:
+                merged.append(current)
+                current = successor
+
+        if current is not None:
+            merged.append(current)
+        return merged
+
+    @property
+    def _intervals(self):
+        """
+        The list of underlying atomic intervals.
+
+        To save memory, an atomic interval is not stored as a list of Atomic
+        instances. Its bounds are stored in the _lower and _upper slots, and the
+        closedness of its boundaries is packed in the _flags bitfield. A
+        non-atomic interval also stores its list of atomic intervals in the
+        _atomics slot, while _flags, _lower and _upper describe its enclosure.
+        Bounds are not set for an empty interval.
+        """
+        flags = self._flags
+        if flags & _MANY:
+            return self._atomics
+        elif flags == _EMPTY:
+            return []
+        return [
+            Atomic(
+                _bounds[flags & _LEFT_CLOSED],
+                self._lower,
+                self._upper,
+                _bounds[(flags & _RIGHT_CLOSED) >> 1],
+            )
+        ]
+
+    @_intervals.setter
+    def _intervals(self, atomics):
+        if len(atomics) == 0:
+            self._flags = _EMPTY
+        elif len(atomics) == 1:
+            self._set_atomic(*atomics[0])
+        else:
+            first, last = atomics[0], atomics[-1]
+            self._set_atomic(first.left, first.lower, last.upper, last.right)
+            self._flags = self._flags | _MANY
+            self._atomics = atomics
+
+    def _set_atomic(self, left, lower, upper, right):
+        """
+        Make current interval a (non-empty) atomic interval.
+
+        :param left: either CLOSED or OPEN.
+        :param lower: value of the lower bound.
+        :param upper: value of the upper bound.
+        :param right: either CLOSED or OPEN.
+        """
+        self._flags = (_LEFT_CLOSED if left is Bound.CLOSED else 0) | (
+            _RIGHT_CLOSED if right is Bound.CLOSED else 0
+        )
+        self._lower, self._upper = lower, upper
+
+    def _cached(self, name, compute):
+        """
+        Return a value derived from the atomic intervals, that is lazily computed
+        and cached. As intervals are immutable, it is computed only once.
+
+        :param name: name of the value.
+        :param compute: a function that computes the value.
+        :return: the value.
+        """
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = compute()
+            return value
+
+    def _lower_bounds(self):
+        """
+        Return the lower bounds of the underlying atomic intervals.
+
+        As intervals are immutable, this list is lazily computed and cached.
+
+        :return: a sorted list of lower bounds.
+        """
+        return self._cached("lowers", lambda: [i.lower for i in self._intervals])
+
+    def _upper_bounds(self):
+        """
+        Return the upper bounds of the underlying atomic intervals.
+
+        As intervals are immutable, this list is lazily computed and cached.
+
+        :return: a sorted list of upper bounds.
+        """
+        return self._cached("uppers", lambda: [i.upper for i in self._intervals])
+
+    def _cumulative_lengths(self):
+        """
+        Return the cumulative lengths of the underlying atomic intervals, the
+        length of an unbounded atomic interval being ignored.
+
+        As intervals are immutable, this list is lazily computed and cached.
+
+        :return: a list whose i-th item is the total length of the i first
+            atomic intervals.
+        """
+        return self._cached("lengths", self._compute_lengths)
+
+    def _compute_lengths(self):
+        """
+        Compute the cumulative lengths of the underlying atomic intervals.
+        """
+        lengths = [
+            None if i.lower == -self._inf or i.upper == self._inf else i.upper - i.lower
+            for i in self._intervals
+        ]
+        bounded = [length for length in lengths if length is not None]
+
+        # Zero of the same type than lengths (e.g., for timedelta)
+        total = bounded[0] - bounded[0] if len(bounded) > 0 else 0
+        cumulative = [total]
+        for length in lengths:
+            total = total if length is None else total + length
+            cumulative.append(total)
+        return cumulative
+
+    def _measure_within(self, lower, upper):
+        """
+        Return the length of the part of current (non-empty) interval that lies
+        between given bounds, in logarithmic time.
+
+        :param lower: lower bound of the window.
+        :param upper: upper bound of the window.
+        :return: a length, or infinity if this part is unbounded.
+        """
+        # Atomic intervals that end after the window starts, and that start
+        # before the window ends.
+        first = bisect_right(self._upper_bounds(), lower)
+        last = bisect_left(self._lower_bounds(), upper) - 1
+
+        if first > last:
+            return self._cumulative_lengths()[0]
+
+        # First and last atomic intervals are clipped, and possibly unbounded
+        lengths = []
+        for i in ((first,) if first == last else (first, last)):
+            atomic = self._intervals[i]
+            clipped_lower = max(atomic.lower, lower)
+            clipped_upper = min(atomic.upper, upper)
+            if clipped_lower == -self._inf or clipped_upper == self._inf:
+                return self._inf
+            lengths.append(clipped_upper - clipped_lower)
+
+        if last > first + 1:
+            cumulative = self._cumulative_lengths()
+            lengths.append(cumulative[last] - cumulative[first + 1])
+
+        return sum(lengths[1:], lengths[0])
+
+    @classmethod
+    def _union_atomics(cls, small, big, lowers=None):
+        """
+        Merge two sorted lists of pairwise non-mergeable atomic intervals.
+
+        Atomic intervals of the big list that are located between two atomic
+        intervals of the small list are copied as-is. If the lower bounds of the
+        big list are provided, they are located using a binary search instead of
+        a linear scan.
+
+        :param small: a list of atomic intervals.
+        :param big: a list of atomic intervals.
+        :param lowers: optional list of the lower bounds of big.
+        :return: a list of pairwise non-mergeable atomic intervals.
+        """
+        mergeable = cls._mergeable
+        merged = []
+        position, length = 0, len(big)
+
+        for atomic in small:
+            # Copy atomic intervals that are strictly before current one
+            if lowers is None:
+                end = position
+                while end < length and big[end].lower < atomic.lower:
+                    end = end + 1
+            else:
+                end = bisect_left(lowers, atomic.lower, position)
+            merged.extend(big[position:end])
+            position = end
+
+            if len(merged) > 0 and mergeable(merged[-1], atomic):
+                merged[-1] = _union(merged[-1], atomic)
+            else:
+                merged.append(atomic)
+
+            # Absorb the next ones, as long as they can be merged
+            while position < length and mergeable(merged[-1], big[position]):
+                merged[-1] = _union(merged[-1], big[position])
+                position = position + 1
+
+        merged.extend(big[position:])
+        return merged
+
+    def _galloping_bounds(self, other):
+        """
+        Return the upper bounds to provide to _intersection and _overlap, i.e.,
+        the ones of the largest interval if it is much larger than the other one.
+
+        :param other: an interval.
+        :return: a pair (uppers, other_uppers) whose items are None or lists.
+        """
+        if 8 * len(self) < len(other):
+            return None, Interval._upper_bounds(other)
+        elif 8 * len(other) < len(self):
+            return Interval._upper_bounds(self), None
+        return None, None
+
+    @classmethod
+    def _intersect_atomic(cls, a, b):
+        """
+        Intersect two non-empty atomic intervals, using their compact
+        representation. The result is normalized with from_atomic if this
+        method is overridden.
+
+        :param a: an atomic interval.
+        :param b: an atomic interval.
+        :return: an Interval instance.
+        """
+        if a._lower == b._lower:
+            left, lower = a._flags & b._flags & _LEFT_CLOSED, a._lower
+        elif a._lower > b._lower:
+            left, lower = a._flags & _LEFT_CLOSED, a._lower
+        else:
+            left, lower = b._flags & _LEFT_CLOSED, b._lower
+
+        if a._upper == b._upper:
+            right, upper = a._flags & b._flags & _RIGHT_CLOSED, a._upper
+        elif a._upper < b._upper:
+            right, upper = a._flags & _RIGHT_CLOSED, a._upper
+        else:
+            right, upper = b._flags & _RIGHT_CLOSED, b._upper
+
+        if cls.from_atomic.__func__ is not Interval.from_atomic.__func__:
+            # Bounds may come from another class, and need to be normalized
+            return cls.from_atomic(
+                _bounds[left], lower, upper, _bounds[right == _RIGHT_CLOSED]
+            )
+        elif lower < upper or (lower == upper and left and right):
+            instance = cls()
+            instance._flags = left | right
+            instance._lower, instance._upper = lower, upper
+            return instance
+        return cls._empty()
+
+    @classmethod
+    def _unite_atomic(cls, a, b):
+        """
+        Unite two non-empty atomic intervals, using their compact representation.
+        This is only supported if _mergeable is not overridden.
+
+        :param a: an atomic interval.
+        :param b: an atomic interval.
+        :return: an Interval instance, or None if the union is not atomic or
+            cannot be computed this way.
+        """
+        if cls._mergeable.__func__ is not Interval._mergeable.__func__:
+            return None
+
+        if a._lower < b._lower or (a._lower == b._lower and a._flags & _LEFT_CLOSED):
+            first, second = a, b
+        else:
+            first, second = b, a
+
+        if first._upper < second._lower or (
+            first._upper == second._lower
+            and not (first._flags & _RIGHT_CLOSED or second._flags & _LEFT_CLOSED)
+        ):
+            return None
+
+        if first._upper == second._upper:
+            right, upper = (first._flags | second._flags) & _RIGHT_CLOSED, first._upper
+        elif first._upper > second._upper:
+            right, upper = first._flags & _RIGHT_CLOSED, first._upper
+        else:
+            right, upper = second._flags & _RIGHT_CLOSED, second._upper
+
+        instance = cls()
+        instance._flags = (first._flags & _LEFT_CLOSED) | right
+        instance._lower, instance._upper = first._lower, upper
+        return instance
+
     @property
     def left(self):
         """
         Lowest left boundary is either CLOSED or OPEN.
         """
-        if self.empty:
-            return Bound.OPEN
-        return self._intervals[0].left
+        return _bounds[self._flags & _LEFT_CLOSED]
 
     @property
     def lower(self):
         """
         Lowest lower bound value.
         """
-        if self.empty:
-            return inf
-        return self._intervals[0].lower
+        return self._inf if self._flags == _EMPTY else self._lower
 
     @property
     def upper(self):
         """
         Highest upper bound value.
         """
-        if self.empty:
-            return -inf
-        return self._intervals[-1].upper
+        return -self._inf if self._flags == _EMPTY else self._upper
 
     @property
     def right(self):
         """
         Highest right boundary is either CLOSED or OPEN.
         """
-        if self.empty:
-            return Bound.OPEN
-        return self._intervals[-1].right
+        return _bounds[(self._flags & _RIGHT_CLOSED) >> 1]
 
     @property
     def empty(self):
         """
         True if interval is empty, False otherwise.
         """
-        return len(self._intervals) == 0
+        return self._flags == _EMPTY
 
     @property
     def atomic(self):
@@ -185,7 +1025,7 @@ class Interval:
         True if this interval is atomic, False otherwise.
         An interval is atomic if it is empty or composed of a single interval.
         """
-        return len(self._intervals) <= 1
+        return not self._flags & _MANY
 
     @property
     def enclosure(self):
@@ -197,6 +1037,31 @@ class Interval:
         """
         return self.__class__.from_atomic(self.left, self.lower, self.upper, self.right)
 
+    def atomics(self):
+        """
+        Return a read-only view on the atomic intervals of current interval.
+
+        Contrary to iterating over the interval, no Interval instance is created:
+        the view supports len, indexing and iteration, and its items are
+        (left, lower, upper, right) 4-uples.
+
+        :return: a sequence of 4-uples.
+        """
+        return AtomicView(self._intervals)
+
+    def intern(self):
+        """
+        Return a canonical instance that is equal to current interval.
+
+        The first interval to be interned becomes the canonical instance for all
+        subsequent equal intervals of the same class, as long as it is referenced
+        elsewhere. This allows many identical intervals (e.g. used as keys) to share
+        a single instance. Bounds must be hashable.
+
+        :return: an Interval instance.
+        """
+        return _interned.setdefault((self.__class__, tuple(self._intervals)), self)
+
     def replace(
         self, left=None, lower=None, upper=None, right=None, *, ignore_inf=True
     ):
@@ -220,6 +1085,7 @@ class Interval:
         :return: an Interval instance
         """
         enclosure = self.enclosure
+        infinities = [-self._inf, self._inf]
 
         if callable(left):
             left = left(enclosure.left)
@@ -227,7 +1093,7 @@ class Interval:
             left = enclosure.left if left is None else left
 
         if callable(lower):
-            if ignore_inf and enclosure.lower in [-inf, inf]:
+            if ignore_inf and enclosure.lower in infinities:
                 lower = enclosure.lower
             else:
                 lower = lower(enclosure.lower)
@@ -235,7 +1101,7 @@ class Interval:
             lower = enclosure.lower if lower is None else lower
 
         if callable(upper):
-            if ignore_inf and enclosure.upper in [-inf, inf]:
+            if ignore_inf and enclosure.upper in infinities:
                 upper = enclosure.upper
             else:
                 upper = upper(enclosure.upper)
@@ -304,7 +1170,62 @@ class Interval:
         :param other: an interval.
         :return: True if intervals are adjacent, False otherwise.
         """
-        return (self & other).empty and (self | other).atomic
+        if not isinstance(other, Interval):
+            raise TypeError("Unsupported type {} for {}".format(type(other), other))
+
+        atomics, others = self._intervals, other._intervals
+        mergeable = self.__class__._mergeable
+        i, o, previous = 0, 0, None
+
+        # Atomic intervals of both intervals, sorted by lower bound, must not
+        # overlap and each of them must be mergeable with the next one.
+        while i < len(atomics) or o < len(others):
+            if o == len(others) or (
+                i < len(atomics)
+                and (
+                    atomics[i].lower < others[o].lower
+                    or (
+                        atomics[i].lower == others[o].lower
+                        and atomics[i].left is Bound.CLOSED
+                    )
+                )
+            ):
+                current, i = atomics[i], i + 1
+            else:
+                current, o = others[o], o + 1
+
+            if previous is not None and not (
+                _before(previous, current) and mergeable(previous, current)
+            ):
+                return False
+            previous = current
+
+        return True
+
+    def relation(self, other):
+        """
+        Return Allen's relation between two intervals (e.g., Relation.BEFORE if
+        current interval is before the other one). Relations MEETS and MET_BY
+        correspond to adjacent intervals.
+
+        Non-atomic intervals are related through their enclosures, except for
+        MEETS and MET_BY that require the nearest atomic intervals to be adjacent.
+
+        :param other: a non-empty interval.
+        :return: a Relation.
+        """
+        if not isinstance(other, Interval):
+            raise TypeError("Unsupported type {} for {}".format(type(other), other))
+        elif self.empty or other.empty:
+            raise ValueError("Relations are not defined for empty intervals.")
+
+        return _relation(
+            self._intervals[0],
+            self._intervals[-1],
+            other._intervals[0],
+            other._intervals[-1],
+            self.__class__._mergeable,
+        )
 
     def overlaps(self, other):
         """
@@ -317,20 +1238,23 @@ class Interval:
             if self.upper < other.lower or self.lower > other.upper:
                 # Early out for clearly non-overlapping intervals
                 return False
+            elif self._flags < _MANY and other._flags < _MANY:
+                # Non-empty atomic intervals overlap unless they only share a bound
+                if self._upper == other._lower:
+                    return (
+                        self._flags & _RIGHT_CLOSED != 0
+                        and other._flags & _LEFT_CLOSED != 0
+                    )
+                elif self._lower == other._upper:
+                    return (
+                        self._flags & _LEFT_CLOSED != 0
+                        and other._flags & _RIGHT_CLOSED != 0
+                    )
+                return True
 
-            i_iter = iter(self)
-            o_iter = iter(other)
-            i_current = next(i_iter, None)
-            o_current = next(o_iter, None)
-
-            while i_current is not None and o_current is not None:
-                if i_current < o_current:
-                    i_current = next(i_iter, None)
-                elif o_current < i_current:
-                    o_current = next(o_iter, None)
-                else:
-                    return True
-            return False
+            return _overlap(
+                self._intervals, other._intervals, *self._galloping_bounds(other)
+            )
         else:
             raise TypeError("Unsupported type {} for {}".format(type(other), other))
 
@@ -343,6 +1267,64 @@ class Interval:
         """
         return self & other
 
+    def clip(self, lower, upper, *, left=Bound.CLOSED, right=Bound.CLOSED):
+        """
+        Return the part of current interval that lies within given bounds.
+
+        This is equivalent to self & self.__class__.from_atomic(left, lower,
+        upper, right), but only the atomic intervals that overlap this window are
+        visited. They are located using a binary search, so that clipping a large
+        interval to a small window takes logarithmic time.
+
+        :param lower: value of the lower bound of the window.
+        :param upper: value of the upper bound of the window.
+        :param left: either CLOSED (default) or OPEN.
+        :param right: either CLOSED (default) or OPEN.
+        :return: an Interval instance.
+        """
+        atomics = self._clip_atomics(left, lower, upper, right)
+        if len(atomics) == 0:
+            return self.__class__._empty()
+        return self.__class__.from_atomics(atomics, presorted=True, disjoint=True)
+
+    def window(self, lower, upper, *, left=Bound.CLOSED, right=Bound.CLOSED):
+        """
+        Return a read-only view on the atomic intervals of the part of current
+        interval that lies within given bounds.
+
+        This is equivalent to self.clip(lower, upper, left=left, right=right)
+        .atomics(), but no Interval instance is created.
+
+        :param lower: value of the lower bound of the window.
+        :param upper: value of the upper bound of the window.
+        :param left: either CLOSED (default) or OPEN.
+        :param right: either CLOSED (default) or OPEN.
+        :return: a sequence of 4-uples.
+        """
+        return AtomicView(self._clip_atomics(left, lower, upper, right))
+
+    def _clip_atomics(self, left, lower, upper, right):
+        """
+        Return the atomic intervals of the part of current interval that lies
+        within given bounds.
+
+        :param left: either CLOSED or OPEN.
+        :param lower: value of the lower bound of the window.
+        :param upper: value of the upper bound of the window.
+        :param right: either CLOSED or OPEN.
+        :return: a sorted list of pairwise disjoint atomic intervals.
+        """
+        window = self.__class__.from_atomic(left, lower, upper, right)
+        if self.atomic or window.empty:
+            return (self & window)._intervals
+
+        # Atomic intervals that do not end before the window starts, and that do
+        # not start after the window ends. Only the first and the last ones can
+        # partially lie outside the window.
+        first = bisect_left(self._upper_bounds(), window.lower)
+        last = bisect_right(self._lower_bounds(), window.upper)
+        return _intersection(self._intervals[first:last], window._intervals)
+
     def union(self, other):
         """
         Return the union of two intervals.
@@ -362,6 +1344,112 @@ class Interval:
         """
         return item in self
 
+    def contains_many(self, values):
+        """
+        Test which of given values are contained in this interval.
+
+        If numpy is available, a boolean array is returned. The test is vectorized
+        if values and bounds are numeric (infinities included), and each value is
+        looked up using a binary search otherwise. If numpy is not available, a list
+        of booleans is returned.
+
+        :param values: an iterable or array-like of comparable values.
+        :return: a boolean array (or list) indicating which values are contained.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [value in self for value in values]
+
+        array = numpy.asarray(values)
+        bounds = [b for i in self._intervals for b in (i.lower, i.upper)]
+
+        if array.dtype.kind not in "biuf" or not all(
+            b == inf or b == -inf or isinstance(b, (int, float, numpy.number))
+            for b in bounds
+        ):
+            return numpy.fromiter(
+                (value in self for value in array.flat), dtype=bool, count=array.size
+            ).reshape(array.shape)
+
+        if self.empty:
+            return numpy.zeros(array.shape, dtype=bool)
+
+        # Only the first lower bound and the last upper bound can be infinities.
+        # They are replaced by a finite bound and handled with masks, so that
+        # finite bounds keep their own type (e.g., no rounding of large integers).
+        atomics = self._intervals
+        positive, negative = self._inf, -self._inf
+        unbounded_below = atomics[0].lower == negative
+        unbounded_above = atomics[-1].upper == positive
+
+        finite = [
+            b
+            for i in atomics
+            for b in (i.lower, i.upper)
+            if not (b == positive or b == negative)
+        ]
+        if len(finite) == 0:
+            return numpy.ones(array.shape, dtype=bool)
+
+        lowers = [i.lower for i in atomics]
+        uppers = [i.upper for i in atomics]
+        if unbounded_below:
+            lowers[0] = finite[0]
+        if unbounded_above:
+            uppers[-1] = finite[-1]
+        lowers, uppers = numpy.array(lowers), numpy.array(uppers)
+        left_closed = numpy.array([i.left == Bound.CLOSED for i in atomics])
+        right_closed = numpy.array([i.right == Bound.CLOSED for i in atomics])
+
+        # Last atomic interval whose lower bound is lower or equal to each value
+        index = numpy.searchsorted(lowers, array, side="right") - 1
+        found = index >= 0
+        index = numpy.where(found, index, 0)
+
+        lower, upper = lowers[index], uppers[index]
+        above_lower = (array > lower) | ((array == lower) & left_closed[index])
+        below_upper = (array < upper) | ((array == upper) & right_closed[index])
+        if unbounded_below:
+            found = found | (index == 0)
+            above_lower = above_lower | (index == 0)
+        if unbounded_above:
+            below_upper = below_upper | (index == len(atomics) - 1)
+        return found & above_lower & below_upper
+
+    def measure(self, within=None):
+        """
+        Return the total length of the underlying atomic intervals, i.e. the sum
+        of the differences between their upper and lower bounds. Bounds are
+        expected to support subtraction (e.g., numbers, or datetimes).
+
+        If a window is provided, only the part of the interval that lies inside
+        this window is measured. Lengths are lazily indexed, so that measuring
+        within an atomic window takes logarithmic time.
+
+        :param within: an interval (default is None).
+        :return: a length, or infinity if the measured part is unbounded.
+        """
+        if within is None:
+            if self.empty:
+                return 0
+            elif self.lower == -self._inf or self.upper == self._inf:
+                return self._inf
+            return self._cumulative_lengths()[-1]
+        elif isinstance(within, Interval):
+            if self.empty or within.empty:
+                return 0
+
+            lengths = []
+            for window in within._intervals:
+                length = self._measure_within(window.lower, window.upper)
+                if length == self._inf:
+                    return self._inf
+                lengths.append(length)
+            return sum(lengths[1:], lengths[0])
+        else:
+            raise TypeError("Unsupported type {} for {}".format(type(within), within))
+
     def complement(self):
         """
         Return the complement of this interval.
@@ -393,15 +1481,19 @@ class Interval:
         raise AttributeError
 
     def __len__(self):
-        return len(self._intervals)
+        if self._flags & _MANY:
+            return len(self._atomics)
+        return 0 if self._flags == _EMPTY else 1
 
     def __iter__(self):
         yield from (self.__class__.from_atomic(*i) for i in self._intervals)
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            return self.__class__(
-                *[self.__class__.from_atomic(*i) for i in self._intervals[item]]
+            return self.__class__.from_atomics(
+                self._intervals[item],
+                presorted=item.step is None or item.step > 0,
+                disjoint=True,
             )
         else:
             return self.__class__.from_atomic(*self._intervals[item])
@@ -412,54 +1504,37 @@ class Interval:
 
         if self.upper < other.lower or self.lower > other.upper:
             # Early out for non-overlapping intervals
-            return self.__class__()
-        elif self.atomic and other.atomic:
-            if self.lower == other.lower:
-                lower = self.lower
-                left = self.left if self.left == Bound.OPEN else other.left
-            else:
-                lower = max(self.lower, other.lower)
-                left = self.left if lower == self.lower else other.left
+            return self.__class__._empty()
+        elif self._flags < _MANY and other._flags < _MANY:
+            return self.__class__._intersect_atomic(self, other)
 
-            if self.upper == other.upper:
-                upper = self.upper
-                right = self.right if self.right == Bound.OPEN else other.right
-            else:
-                upper = min(self.upper, other.upper)
-                right = self.right if upper == self.upper else other.right
-
-            return self.__class__.from_atomic(left, lower, upper, right)
-        else:
-            intersections = []
-
-            i_iter = iter(self)
-            o_iter = iter(other)
-            i_current = next(i_iter, None)
-            o_current = next(o_iter, None)
-
-            while i_current is not None and o_current is not None:
-                if i_current < o_current:
-                    i_current = next(i_iter, None)
-                elif o_current < i_current:
-                    o_current = next(o_iter, None)
-                else:
-                    # i_current and o_current have an overlap
-                    intersections.append(i_current & o_current)
-
-                    if i_current <= o_current:
-                        # o_current can still intersect next i
-                        i_current = next(i_iter, None)
-                    elif o_current <= i_current:
-                        # i_current can still intersect next o
-                        o_current = next(o_iter, None)
-                    else:
-                        assert False
-
-            return self.__class__(*intersections)
+        intersection = _intersection(
+            self._intervals, other._intervals, *self._galloping_bounds(other)
+        )
+        # Bounds may come from another class, and need to be normalized
+        return self.__class__._from_sorted_atomics(intersection)
 
     def __or__(self, other):
         if isinstance(other, Interval):
-            return self.__class__(self, other)
+            if not isinstance(other, self.__class__):
+                # Atomic intervals of other may be mergeable w.r.t. this class
+                return self.__class__(self, other)
+            elif self._flags < _MANY and other._flags < _MANY:
+                union = self.__class__._unite_atomic(self, other)
+                if union is not None:
+                    return union
+
+            if len(self) <= len(other):
+                small, big = self, other
+            else:
+                small, big = other, self
+
+            # Locate atomic intervals using a binary search if sizes differ a lot
+            lowers = Interval._lower_bounds(big) if 8 * len(small) < len(big) else None
+            atomics = self.__class__._union_atomics(
+                small._intervals, big._intervals, lowers
+            )
+            return self.__class__.from_atomics(atomics, presorted=True, disjoint=True)
         else:
             return NotImplemented
 
@@ -481,18 +1556,20 @@ class Interval:
                 )
                 return left and right
             else:
-                selfiter = iter(self)
-                current = next(selfiter)
-
-                for other in item:
-                    while current < other:
-                        try:
-                            current = next(selfiter)
-                        except StopIteration:
+                atomics = self._intervals
+                position, length = 0, len(atomics)
+
+                # Skip atomic intervals using a galloping search if item is small
+                uppers = self._upper_bounds() if 8 * len(item) < length else None
+
+                for other in item._intervals:
+                    while _before(atomics[position], other):
+                        position = _skip(uppers, position, other)
+                        if position == length:
                             return False
 
                     # here current and other could have an overlap
-                    if other not in current:
+                    if not _includes(atomics[position], other):
                         return False
                 return True
         else:
@@ -500,37 +1577,43 @@ class Interval:
             if self.upper < item or self.lower > item:
                 return False
 
-            for i in self._intervals:
-                left = (item >= i.lower) if i.left == Bound.CLOSED else (item > i.lower)
-                right = (
-                    (item <= i.upper) if i.right == Bound.CLOSED else (item < i.upper)
-                )
-                if left and right:
-                    return True
-            return False
+            if self._flags < _MANY:
+                lower, upper = self._lower, self._upper
+                left = item >= lower if self._flags & _LEFT_CLOSED else item > lower
+                right = item <= upper if self._flags & _RIGHT_CLOSED else item < upper
+                return left and right
 
-    def __invert__(self):
-        complements = [
-            self.__class__.from_atomic(Bound.OPEN, -inf, self.lower, ~self.left),
-            self.__class__.from_atomic(~self.right, self.upper, inf, Bound.OPEN),
-        ]
+            # Last atomic interval whose lower bound is lower or equal to item
+            i = self._intervals[bisect_right(self._lower_bounds(), item) - 1]
 
-        for i, j in zip(self._intervals[:-1], self._intervals[1:]):
-            complements.append(
-                self.__class__.from_atomic(~i.right, i.upper, j.lower, ~j.left)
-            )
+            left = (item >= i.lower) if i.left == Bound.CLOSED else (item > i.lower)
+            right = (item <= i.upper) if i.right == Bound.CLOSED else (item < i.upper)
+            return left and right
 
-        return self.__class__(*complements)
+    def __invert__(self):
+        return self.__class__._from_sorted_atomics(
+            _difference(
+                [Atomic(Bound.OPEN, -self._inf, self._inf, Bound.OPEN)], self._intervals
+            )
+        )
 
     def __sub__(self, other):
         if isinstance(other, Interval):
-            return self & ~other
+            return self.__class__._from_sorted_atomics(
+                _difference(self._intervals, other._intervals)
+            )
         else:
             return NotImplemented
 
     def __eq__(self, other):
         if isinstance(other, Interval):
-            if len(other._intervals) != len(self._intervals):
+            if not (self._flags & _MANY or other._flags & _MANY):
+                # Flags are equal for empty intervals
+                return self._flags == other._flags and (
+                    self._flags == _EMPTY
+                    or (self._lower == other._lower and self._upper == other._upper)
+                )
+            elif len(other._intervals) != len(self._intervals):
                 return False
 
             for a, b in zip(self._intervals, other._intervals):
@@ -615,7 +1698,27 @@ class Interval:
             return not self.empty and self.lower >= other
 
     def __hash__(self):
-        return hash(tuple([self.lower, self.upper]))
+        if self._flags == _EMPTY:
+            return hash(())
+        elif self._flags < _MANY:
+            # Not cached, to keep atomic intervals compact
+            return hash((self._flags, self._lower, self._upper))
+        return self._cached("hash", lambda: hash(tuple(self._intervals)))
+
+    def __getstate__(self):
+        # Cached values are not pickled, as hash values may differ between processes
+        if self._flags == _EMPTY:
+            return (self._flags,)
+        elif self._flags < _MANY:
+            return (self._flags, self._lower, self._upper)
+        return (self._flags, self._lower, self._upper, self._atomics)
+
+    def __setstate__(self, state):
+        self._flags = state[0]
+        if len(state) > 1:
+            self._lower, self._upper = state[1], state[2]
+        if len(state) > 3:
+            self._atomics = state[3]
 
     def __repr__(self):
         if self.empty:
@@ -652,6 +1755,8 @@ class AbstractDiscreteInterval(Interval):
     occur even in minor or patch updates of portion_master.
     """
 
+    __slots__ = ()
+
     _step = None
 
     @classmethod
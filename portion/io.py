@@ -1,7 +1,41 @@
 import re
+import struct
+import zlib
 
-from .const import Bound, inf
-from .interval import Interval
+from functools import lru_cache, partial
+
+from .const import Bound
+from .dict import IntervalDict
+from .interval import Atomic, Interval
+from .intervaltree import Node
+
+
+# Create an Atomic from a 4-uple, without calling Atomic.__new__
+_atomic = partial(tuple.__new__, Atomic)
+
+# Boundaries, indexed by whether they are closed
+_bounds = (Bound.OPEN, Bound.CLOSED)
+
+# Parameters of from_string for the default syntax, that is parsed by _scan
+_DEFAULT_SYNTAX = (
+    r".+?",
+    r" ?\| ?",
+    r", ?",
+    r"\(",
+    r"\[",
+    r"\)",
+    r"\]",
+    r"\+inf",
+    r"-inf",
+)
+
+# Atomic interval in the default syntax, followed by a disjunctive operator if
+# another atomic interval follows. Bounds cannot contain a separator or a
+# boundary, so that this pattern does not backtrack: bounds that contain them
+# are not matched, and are left to the default patterns.
+_ATOMIC = re.compile(
+    r"([(\[])(?:([^,)\]\n]+)(?:, ?([^)\]\n]+))?)?([)\]])( ?\| ?(?=[(\[]))?"
+)
 
 
 def from_string(
@@ -41,7 +75,121 @@ def from_string(
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
+    syntax = (bound, disj, sep, left_open, left_closed, right_open, right_closed)
+    syntax = syntax + (pinf, ninf)
+    if syntax == _DEFAULT_SYNTAX:
+        interval = _scan(string, conv, klass)
+        if interval is not None:
+            return interval
+    return _parse(string, conv, klass, _compile(*syntax))
+
+
+def from_strings(
+    strings,
+    conv,
+    *,
+    bound=r".+?",
+    disj=r" ?\| ?",
+    sep=r", ?",
+    left_open=r"\(",
+    left_closed=r"\[",
+    right_open=r"\)",
+    right_closed=r"\]",
+    pinf=r"\+inf",
+    ninf=r"-inf",
+    klass=Interval,
+    cache_size=None,
+):
+    """
+    Parse given strings and (lazily) create an Interval instance for each of them.
+
+    This is equivalent to calling from_string on each string, but patterns are
+    compiled once. If cache_size is set, the intervals of the most recently
+    parsed strings are kept, so that repeated strings are parsed only once.
+    This function raises a ValueError if a string cannot be parsed to an interval.
+
+    See from_string for the parameters that are not described hereafter.
+
+    :param strings: an iterable of strings to parse.
+    :param conv: function that converts a bound (as string) to an object.
+    :param cache_size: number of parsed strings to cache (default is None, to
+        disable caching).
+    :return: a lazy iterator of intervals.
+    """
+    syntax = (bound, disj, sep, left_open, left_closed, right_open, right_closed)
+    syntax = syntax + (pinf, ninf)
+    patterns = _compile(*syntax)
+    default = syntax == _DEFAULT_SYNTAX
+
+    def parse(string):
+        if default:
+            interval = _scan(string, conv, klass)
+            if interval is not None:
+                return interval
+        return _parse(string, conv, klass, patterns)
+
+    if cache_size is not None:
+        parse = lru_cache(maxsize=cache_size)(parse)
+
+    for string in strings:
+        yield parse(string)
+
+
+def from_file(
+    file,
+    conv,
+    *,
+    bound=r".+?",
+    disj=r" ?\| ?",
+    sep=r", ?",
+    left_open=r"\(",
+    left_closed=r"\[",
+    right_open=r"\)",
+    right_closed=r"\]",
+    pinf=r"\+inf",
+    ninf=r"-inf",
+    klass=Interval,
+    cache_size=None,
+):
+    """
+    Read intervals from given text file, one interval per line. Lines are read
+    and parsed incrementally.
+
+    See from_strings for the parameters that are not described hereafter.
+
+    :param file: a file-like object opened in text mode (or any iterable of lines).
+    :param conv: function that converts a bound (as string) to an object.
+    :return: a lazy iterator of intervals.
+    """
+    return from_strings(
+        (line.rstrip("\n") for line in file),
+        conv,
+        bound=bound,
+        disj=disj,
+        sep=sep,
+        left_open=left_open,
+        left_closed=left_closed,
+        right_open=right_open,
+        right_closed=right_closed,
+        pinf=pinf,
+        ninf=ninf,
+        klass=klass,
+        cache_size=cache_size,
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile(
+    bound, disj, sep, left_open, left_closed, right_open, right_closed, pinf, ninf
+):
+    """
+    Compile the patterns that are used to parse intervals. Compiled patterns
+    are cached for each set of parameters of from_string.
 
+    :return: a 6-uple of compiled patterns, respectively matching an atomic
+        interval, the disjunctive operator, a left closed boundary, a right
+        closed boundary, a positive infinity and a negative infinity.
+    """
     re_left_boundary = r"(?P<left>{}|{})".format(left_open, left_closed)
     re_right_boundary = r"(?P<right>{}|{})".format(right_open, right_closed)
     re_bounds = r"(?P<lower>{bound})({sep}(?P<upper>{bound}))?".format(
@@ -49,50 +197,129 @@ def from_string(
     )
     re_interval = r"{}(|{}){}".format(re_left_boundary, re_bounds, re_right_boundary)
 
-    intervals = []
-    has_more = True
-    source = string
+    return (
+        re.compile(re_interval),
+        re.compile(disj),
+        re.compile(left_closed + "$"),
+        re.compile(right_closed + "$"),
+        re.compile(pinf),
+        re.compile(ninf),
+    )
+
+
+def _parse(string, conv, klass, patterns):
+    """
+    Parse given string and create an Interval instance, using compiled patterns.
+
+    :param string: string to parse.
+    :param conv: function that converts a bound (as string) to an object.
+    :param klass: class to use for creating intervals.
+    :param patterns: compiled patterns, see _compile.
+    :return: an interval.
+    """
+    re_interval, re_disj, re_left_closed, re_right_closed, re_pinf, re_ninf = patterns
+    positive, negative = klass._inf, -klass._inf
 
     def _convert(bound):
-        if re.match(pinf, bound):
-            return inf
-        elif re.match(ninf, bound):
-            return -inf
+        if re_pinf.match(bound):
+            return positive
+        elif re_ninf.match(bound):
+            return negative
         else:
             return conv(bound)
 
-    while has_more:
-        match = re.match(re_interval, string)
+    intervals = []
+    position, length = 0, len(string)
+
+    while True:
+        # Patterns are matched from current position, without slicing string
+        match = re_interval.match(string, position)
         if match is None:
-            raise ValueError('"{}" cannot be parsed to an interval.'.format(source))
+            raise ValueError('"{}" cannot be parsed to an interval.'.format(string))
 
         # Parse atomic interval
-        group = match.groupdict()
+        left, lower, upper, right = match.group("left", "lower", "upper", "right")
 
-        left = (
-            Bound.CLOSED if re.match(left_closed + "$", group["left"]) else Bound.OPEN
-        )
-        right = (
-            Bound.CLOSED if re.match(right_closed + "$", group["right"]) else Bound.OPEN
-        )
-        lower = group.get("lower", None)
-        upper = group.get("upper", None)
-        lower = _convert(lower) if lower is not None else inf
+        left = Bound.CLOSED if re_left_closed.match(left) else Bound.OPEN
+        right = Bound.CLOSED if re_right_closed.match(right) else Bound.OPEN
+        lower = _convert(lower) if lower is not None else positive
         upper = _convert(upper) if upper is not None else lower
 
         intervals.append(klass.from_atomic(left, lower, upper, right))
-        string = string[match.end() :]
+        position = match.end()
 
         # Are there more atomic intervals?
-        if len(string) > 0:
-            match = re.match(disj, string)
-            if match is None:
-                raise ValueError('"{}" cannot be parsed to an interval.'.format(source))
-            else:
-                string = string[match.end() :]
+        if position == length:
+            break
+
+        match = re_disj.match(string, position)
+        if match is None:
+            raise ValueError('"{}" cannot be parsed to an interval.'.format(string))
+        position = match.end()
+
+    if len(intervals) == 1:
+        return intervals[0]
+    return klass(*intervals)
+
+
+def _scan(string, conv, klass):
+    """
+    Parse given string with the default syntax of from_string, in a single pass.
+    The result is the same as the one of _parse with the default patterns.
+
+    :param string: string to parse.
+    :param conv: function that converts a bound (as string) to an object.
+    :param klass: class to use for creating intervals.
+    :return: an interval, or None if given string has to be parsed by _parse
+        (e.g., to report an error or to deal with ambiguous bounds).
+    """
+    positive, negative = klass._inf, -klass._inf
+    match = _ATOMIC.match
+
+    intervals = []
+    position, length = 0, len(string)
+
+    while position < length:
+        atomic = match(string, position)
+        if atomic is None:
+            return None
+
+        left, lower, upper, right, disj = atomic.groups()
+        position = atomic.end()
+        if disj is None and position < length:
+            return None
+
+        if lower is None:
+            lower = positive
+        elif lower.startswith("+inf"):
+            lower = positive
+        elif lower.startswith("-inf"):
+            lower = negative
         else:
-            has_more = False
+            lower = conv(lower)
+
+        if upper is None:
+            upper = lower
+        elif upper.startswith("+inf"):
+            upper = positive
+        elif upper.startswith("-inf"):
+            upper = negative
+        else:
+            upper = conv(upper)
+
+        intervals.append(
+            klass.from_atomic(
+                Bound.CLOSED if left == "[" else Bound.OPEN,
+                lower,
+                upper,
+                Bound.CLOSED if right == "]" else Bound.OPEN,
+            )
+        )
 
+    if len(intervals) == 0:
+        return None
+    elif len(intervals) == 1:
+        return intervals[0]
     return klass(*intervals)
 
 
@@ -127,51 +354,111 @@ def to_string(
     if interval.empty:
         return left_open + right_open
 
+    # Infinities may be specific to the class of the interval
+    positive, negative = interval._inf, -interval._inf
+
     def _convert(bound):
-        if bound == inf:
+        if bound == positive:
             return pinf
-        elif bound == -inf:
+        elif bound == negative:
             return ninf
         else:
             return conv(bound)
 
+    # Atomic intervals are formatted in a single pass, without creating intervals
     exported_intervals = []
-    for item in interval:
-        left = left_open if item.left == Bound.OPEN else left_closed
-        right = right_open if item.right == Bound.OPEN else right_closed
-
-        lower = _convert(item.lower)
-        upper = _convert(item.upper)
+    for left, lower, upper, right in interval._intervals:
+        left = left_open if left == Bound.OPEN else left_closed
+        right = right_open if right == Bound.OPEN else right_closed
 
-        if item.lower == item.upper:
-            exported_intervals.append(left + lower + right)
+        if lower == upper:
+            exported_intervals.append(left + _convert(lower) + right)
         else:
-            exported_intervals.append(left + lower + sep + upper + right)
+            exported_intervals.append(
+                left + _convert(lower) + sep + _convert(upper) + right
+            )
 
     return disj.join(exported_intervals)
 
 
+def to_file(
+    intervals,
+    file,
+    conv=repr,
+    *,
+    disj=" | ",
+    sep=",",
+    left_open="(",
+    left_closed="[",
+    right_open=")",
+    right_closed="]",
+    pinf="+inf",
+    ninf="-inf",
+):
+    """
+    Write given intervals to given text file, one interval per line. Intervals
+    are exported and written incrementally.
+
+    See to_string for the parameters that are not described hereafter.
+
+    :param intervals: an iterable of intervals.
+    :param file: a file-like object opened in text mode.
+    :param conv: function that is used to represent a bound (default is `repr`).
+    """
+    file.writelines(
+        to_string(
+            interval,
+            conv,
+            disj=disj,
+            sep=sep,
+            left_open=left_open,
+            left_closed=left_closed,
+            right_open=right_open,
+            right_closed=right_closed,
+            pinf=pinf,
+            ninf=ninf,
+        )
+        + "\n"
+        for interval in intervals
+    )
+
+
 def from_data(
-    data, conv=None, *, pinf=float("inf"), ninf=float("-inf"), klass=Interval
+    data,
+    conv=None,
+    *,
+    pinf=float("inf"),
+    ninf=float("-inf"),
+    klass=Interval,
+    trusted=False,
 ):
     """
     Import an interval from a piece of data.
 
-    :param data: a list of 4-uples (left, lower, upper, right).
+    If data is trusted, its atomic intervals are expected to be sorted, disjoint
+    and normalized, with Boolean boundaries (e.g., as exported by to_data or
+    iter_data). They are used as-is, and only the first lower bound and the last
+    upper bound are compared with ninf and pinf.
+
+    :param data: an iterable of 4-uples (left, lower, upper, right).
     :param conv: function that converts "lower" and "upper" to bounds, default to identity.
     :param pinf: value used to represent positive infinity.
     :param ninf: value used to represent negative infinity.
     :param klass: class to use for creating intervals (default to Interval).
+    :param trusted: set to True if data is canonical (default is False).
     :return: an interval.
     """
+    if trusted:
+        return _from_trusted_data(data, conv, pinf, ninf, klass)
+
     intervals = []
     conv = (lambda v: v) if conv is None else conv
 
     def _convert(bound):
         if bound == pinf:
-            return inf
+            return klass._inf
         elif bound == ninf:
-            return -inf
+            return -klass._inf
         else:
             return conv(bound)
 
@@ -188,6 +475,31 @@ def from_data(
     return klass(*intervals)
 
 
+def _from_trusted_data(data, conv, pinf, ninf, klass):
+    """
+    Import an interval from canonical data (see from_data), in a single pass.
+    """
+    conv = (lambda v: v) if conv is None else conv
+    atomics = []
+    rows = iter(data)
+
+    row = next(rows, None)
+    if row is None:
+        return klass._empty()
+    left, lower, upper, right = row
+    lower = -klass._inf if lower == ninf else conv(lower)
+
+    # Upper bound of each row is converted once the next row is known, as only
+    # the last one can be an infinity
+    for next_left, next_lower, next_upper, next_right in rows:
+        atomics.append(_atomic((_bounds[left], lower, conv(upper), _bounds[right])))
+        left, lower, upper, right = next_left, conv(next_lower), next_upper, next_right
+
+    upper = klass._inf if upper == pinf else conv(upper)
+    atomics.append(_atomic((_bounds[left], lower, upper, _bounds[right])))
+    return klass.from_atomics(atomics, presorted=True, disjoint=True)
+
+
 def to_data(interval, conv=None, *, pinf=float("inf"), ninf=float("-inf")):
     """
     Export given interval to a list of 4-uples (left, lower,
@@ -199,25 +511,483 @@ def to_data(interval, conv=None, *, pinf=float("inf"), ninf=float("-inf")):
     :param ninf: value used to encode negative infinity.
     :return: a list of 4-uples (left, lower, upper, right)
     """
+    return list(iter_data(interval, conv, pinf=pinf, ninf=ninf))
+
+
+def iter_data(interval, conv=None, *, pinf=float("inf"), ninf=float("-inf")):
+    """
+    Export given interval to 4-uples (left, lower, upper, right), lazily.
+
+    See to_data for the parameters.
+
+    :return: a lazy iterator of 4-uples (left, lower, upper, right).
+    """
     conv = (lambda v: v) if conv is None else conv
 
-    data = []
+    # Infinities may be specific to the class of the interval
+    positive, negative = interval._inf, -interval._inf
 
     def _convert(bound):
-        if bound == inf:
+        if bound == positive:
             return pinf
-        elif bound == -inf:
+        elif bound == negative:
             return ninf
         else:
             return conv(bound)
 
-    for item in interval:
-        data.append(
-            (
-                item.left.value,
-                _convert(item.lower),
-                _convert(item.upper),
-                item.right.value,
+    # Atomic intervals are exported without creating intervals
+    for left, lower, upper, right in interval._intervals:
+        yield (
+            left is Bound.CLOSED,
+            _convert(lower),
+            _convert(upper),
+            right is Bound.CLOSED,
+        )
+
+
+def from_arrays(
+    lowers, uppers, left_closed, right_closed, *, canonical=False, klass=Interval
+):
+    """
+    Import an interval from four array-likes: the lower bounds, the upper bounds,
+    and whether they are closed (either arrays of Booleans, or a single Boolean).
+    Infinities are represented by float ones. This function requires numpy.
+
+    Atomic intervals can be unsorted, overlapping or empty, and are normalized
+    with vectorized operations. If they are known to be sorted, disjoint and
+    normalized (e.g., as exported by to_arrays), canonical can be set to True
+    to use them as-is.
+
+    :param lowers: array-like of lower bounds.
+    :param uppers: array-like of upper bounds.
+    :param left_closed: array-like of Booleans, True if lower bound is closed.
+    :param right_closed: array-like of Booleans, True if upper bound is closed.
+    :param canonical: set to True if atomic intervals are sorted, disjoint and
+        normalized (default is False).
+    :param klass: class to use for creating intervals (default to Interval).
+    :return: an interval.
+    """
+    import numpy
+
+    lowers, uppers = numpy.asarray(lowers), numpy.asarray(uppers)
+    left_closed = numpy.broadcast_to(
+        numpy.asarray(left_closed, dtype=bool), lowers.shape
+    )
+    right_closed = numpy.broadcast_to(
+        numpy.asarray(right_closed, dtype=bool), uppers.shape
+    )
+
+    if not canonical:
+        from .array import _sweep
+
+        # Infinities are open, and empty atomic intervals are dropped
+        if lowers.dtype.kind == "f":
+            left_closed = left_closed & numpy.isfinite(lowers)
+        if uppers.dtype.kind == "f":
+            right_closed = right_closed & numpy.isfinite(uppers)
+        keep = (lowers < uppers) | ((lowers == uppers) & left_closed & right_closed)
+
+        columns = (lowers[keep], uppers[keep], left_closed[keep], right_closed[keep])
+        lowers, uppers, left_closed, right_closed = _sweep(*columns, 1)
+
+    lowers, uppers = lowers.tolist(), uppers.tolist()
+    if len(lowers) == 0:
+        return klass._empty()
+
+    # Only the first and the last bounds can be infinities
+    if lowers[0] == float("-inf"):
+        lowers[0] = -klass._inf
+    if uppers[-1] == float("inf"):
+        uppers[-1] = klass._inf
+
+    lefts = map(_bounds.__getitem__, left_closed.tolist())
+    rights = map(_bounds.__getitem__, right_closed.tolist())
+    atomics = list(map(_atomic, zip(lefts, lowers, uppers, rights)))
+
+    if canonical:
+        return klass.from_atomics(atomics, presorted=True, disjoint=True)
+    return klass._from_sorted_atomics(atomics)
+
+
+def to_arrays(interval):
+    """
+    Export given interval to four numpy arrays: the lower bounds, the upper
+    bounds, and whether they are closed. Infinities are represented by float
+    ones. This function requires numpy.
+
+    :param interval: an interval.
+    :return: a 4-uple of arrays (lowers, uppers, left_closed, right_closed).
+    """
+    import numpy
+
+    atomics = interval._intervals
+    if len(atomics) == 0:
+        return (
+            numpy.array([], dtype=float),
+            numpy.array([], dtype=float),
+            numpy.array([], dtype=bool),
+            numpy.array([], dtype=bool),
+        )
+
+    lefts, lowers, uppers, rights = (list(column) for column in zip(*atomics))
+
+    # Only the first and the last bounds can be infinities
+    if lowers[0] == -interval._inf:
+        lowers[0] = float("-inf")
+    if uppers[-1] == interval._inf:
+        uppers[-1] = float("inf")
+
+    return (
+        numpy.array(lowers),
+        numpy.array(uppers),
+        numpy.array([left is Bound.CLOSED for left in lefts], dtype=bool),
+        numpy.array([right is Bound.CLOSED for right in rights], dtype=bool),
+    )
+
+
+# Version of the binary layout produced by to_bytes
+_VERSION = 1
+
+# Flags of the binary layout
+_COMPRESSED = 1  # content is compressed with zlib
+_DICT = 2  # content is an IntervalDict
+_FLOATS = 4  # bounds are floats (otherwise, integers)
+_DUMPS = 8  # values are converted with a user-provided function
+
+# Infinities of the binary layout
+_NINF = 1  # lower bound of the first atomic interval is -inf
+_PINF = 2  # upper bound of the last atomic interval is +inf
+
+# Left and right boundaries of the 4 atomic intervals packed in each byte
+_LEFTS = [
+    tuple(Bound.CLOSED if byte >> shift & 1 else Bound.OPEN for shift in (0, 2, 4, 6))
+    for byte in range(256)
+]
+_RIGHTS = [
+    tuple(Bound.CLOSED if byte >> shift & 2 else Bound.OPEN for shift in (0, 2, 4, 6))
+    for byte in range(256)
+]
+
+
+# Tags of the values of an IntervalDict in the binary layout
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES = range(7)
+
+
+def to_bytes(item, conv=None, *, compress=False, dumps=None):
+    """
+    Export given interval or IntervalDict to bytes, using a compact (and
+    versioned) binary layout.
+
+    Bounds have to be integers or floats, possibly after being converted with
+    conv. Integer bounds are delta and varint encoded. The values of an
+    IntervalDict are stored once, and have to be None, booleans, integers,
+    floats, strings or bytes, unless dumps is provided.
+
+    :param item: an interval or an IntervalDict.
+    :param conv: function that converts (finite) bounds to integers or floats,
+        default to identity.
+    :param compress: set to True to compress the result with zlib (default is False).
+    :param dumps: function that converts a value of an IntervalDict to bytes
+        (optional).
+    :return: a bytes object.
+    """
+    if isinstance(item, IntervalDict):
+        flags = _DICT
+        positive = item._klass._inf
+
+        # Atomic intervals of all the values are sorted and disjoint
+        atomics, indexes, values, table = [], [], [], {}
+        node = item._storage.root.minimum
+        while not node.is_nil:
+            index = _index(table, values, node.value)
+            for atomic in node.interval._intervals:
+                atomics.append(atomic)
+                indexes.append(index)
+            node = item._storage.successor(node)
+    elif isinstance(item, Interval):
+        flags = 0
+        positive = item._inf
+        atomics = item._intervals
+    else:
+        raise TypeError("Unsupported type {} for {}".format(type(item), item))
+
+    content = bytearray()
+    _write_varint(content, len(atomics))
+
+    # Boundaries are packed, 4 atomic intervals per byte
+    boundaries = bytearray((len(atomics) + 3) // 4)
+    for i, (left, _, _, right) in enumerate(atomics):
+        shift = (i & 3) * 2
+        if left == Bound.CLOSED:
+            boundaries[i >> 2] |= 1 << shift
+        if right == Bound.CLOSED:
+            boundaries[i >> 2] |= 2 << shift
+
+    # Only the first and the last bounds can be infinities
+    bounds = [bound for _, lower, upper, _ in atomics for bound in (lower, upper)]
+    infinities = 0
+    if len(bounds) > 0 and bounds[0] == -positive:
+        infinities |= _NINF
+        bounds = bounds[1:]
+    if len(bounds) > 0 and bounds[-1] == positive:
+        infinities |= _PINF
+        bounds = bounds[:-1]
+
+    content.append(infinities)
+    content += boundaries
+
+    if conv is not None:
+        bounds = [conv(bound) for bound in bounds]
+
+    types = set(map(type, bounds))
+    if types <= {int} or all(isinstance(bound, int) for bound in bounds):
+        previous = 0
+        for bound in bounds:
+            delta = bound - previous
+            delta = 2 * delta if delta >= 0 else -2 * delta - 1
+            # Inlined _write_varint for deltas up to 2 bytes
+            if delta < 0x80:
+                content.append(delta)
+            elif delta < 0x4000:
+                content.append(delta & 0x7F | 0x80)
+                content.append(delta >> 7)
+            else:
+                _write_varint(content, delta)
+            previous = bound
+    elif types <= {int, float} or all(
+        isinstance(bound, (int, float)) for bound in bounds
+    ):
+        flags |= _FLOATS
+        content += struct.pack("<{}d".format(len(bounds)), *bounds)
+    else:
+        raise TypeError("Bounds must be integers or floats, use conv to convert them.")
+
+    if flags & _DICT:
+        if dumps is not None:
+            flags |= _DUMPS
+        _write_varint(content, len(values))
+        for value in values:
+            _write_value(content, value, dumps)
+        for index in indexes:
+            _write_varint(content, index)
+
+    if compress:
+        flags |= _COMPRESSED
+        content = zlib.compress(content)
+
+    return bytes((_VERSION, flags)) + content
+
+
+def from_bytes(data, conv=None, *, loads=None, klass=Interval, dict_klass=IntervalDict):
+    """
+    Import an interval or an IntervalDict from bytes produced by to_bytes.
+
+    Atomic intervals are trusted to be sorted, disjoint and normalized (as they
+    are exported by to_bytes), and are used as-is.
+    This function raises a ValueError if given bytes cannot be decoded.
+
+    :param data: a bytes-like object.
+    :param conv: function that converts (finite) bounds, default to identity.
+    :param loads: function that converts bytes to a value of an IntervalDict,
+        required if dumps was provided to to_bytes.
+    :param klass: class to use for creating intervals (default to Interval).
+    :param dict_klass: class to use for creating IntervalDict instances
+        (default to IntervalDict). Its intervals are created with its own class.
+    :return: an interval or an IntervalDict.
+    """
+    data = bytes(data)
+    if len(data) < 2 or data[0] != _VERSION:
+        raise ValueError("Unsupported binary layout.")
+
+    flags = data[1]
+    if flags & _DUMPS and loads is None:
+        raise ValueError("Values can only be decoded with loads.")
+    if flags & _DICT:
+        klass = dict_klass._klass
+
+    try:
+        content = zlib.decompress(data[2:]) if flags & _COMPRESSED else data[2:]
+        loads = loads if flags & _DUMPS else None
+        return _read(content, flags, conv, loads, klass, dict_klass)
+    except (IndexError, struct.error, zlib.error, UnicodeDecodeError):
+        raise ValueError("Data cannot be decoded.") from None
+
+
+def _read(content, flags, conv, loads, klass, dict_klass):
+    """
+    Decode the content of the binary layout (see from_bytes).
+    """
+    length, position = _read_varint(content, 0)
+    infinities = content[position]
+    position = position + 1
+
+    size = (length + 3) // 4
+    boundaries = content[position : position + size]
+    position = position + size
+    if len(boundaries) < size:
+        raise ValueError("Data cannot be decoded.")
+
+    count = 2 * length
+    count = count - (1 if infinities & _NINF else 0)
+    count = count - (1 if infinities & _PINF else 0)
+    if flags & _FLOATS:
+        bounds = list(struct.unpack_from("<{}d".format(count), content, position))
+        position = position + 8 * count
+    else:
+        bounds, previous = [], 0
+        for _ in range(count):
+            # Inlined _read_varint for deltas up to 2 bytes
+            delta = content[position]
+            if delta < 0x80:
+                position = position + 1
+            elif content[position + 1] < 0x80:
+                delta = delta & 0x7F | content[position + 1] << 7
+                position = position + 2
+            else:
+                delta, position = _read_varint(content, position)
+            previous = previous + (-(delta >> 1) - 1 if delta & 1 else delta >> 1)
+            bounds.append(previous)
+
+    if conv is not None:
+        bounds = [conv(bound) for bound in bounds]
+    if infinities & _NINF:
+        bounds.insert(0, -klass._inf)
+    if infinities & _PINF:
+        bounds.append(klass._inf)
+
+    lefts = [left for byte in boundaries for left in _LEFTS[byte]]
+    rights = [right for byte in boundaries for right in _RIGHTS[byte]]
+    atomics = list(map(_atomic, zip(lefts, bounds[0::2], bounds[1::2], rights)))
+
+    if not flags & _DICT:
+        if length == 0:
+            result = klass()
+        else:
+            result = klass.from_atomics(atomics, presorted=True, disjoint=True)
+    else:
+        count, position = _read_varint(content, position)
+        values = []
+        for _ in range(count):
+            value, position = _read_value(content, position, loads)
+            values.append(value)
+
+        # Atomic intervals are disjoint, they are inserted without being merged
+        result = dict_klass()
+        for atomic in atomics:
+            index, position = _read_varint(content, position)
+            interval = klass.from_atomics([atomic], presorted=True, disjoint=True)
+            result._storage.insert(Node(interval, values[index]))
+
+    if position != len(content):
+        raise ValueError("Data cannot be decoded.")
+    return result
+
+
+def _index(table, values, value):
+    """
+    Return the position of given value in values, adding it if needed. Table
+    maps hashable values (and their type) to their position.
+    """
+    try:
+        key = (type(value), value)
+        if key not in table:
+            table[key] = len(values)
+            values.append(value)
+        return table[key]
+    except TypeError:
+        for i, other in enumerate(values):
+            if type(other) is type(value) and other == value:
+                return i
+        values.append(value)
+        return len(values) - 1
+
+
+def _write_varint(buffer, value):
+    """
+    Append given non-negative integer to buffer, 7 bits per byte.
+    """
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value = value >> 7
+    buffer.append(value)
+
+
+def _read_varint(content, position):
+    """
+    Read a non-negative integer from content at given position.
+
+    :return: a pair (integer, position after the integer).
+    """
+    result = shift = 0
+    while True:
+        byte = content[position]
+        position = position + 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift = shift + 7
+
+
+def _write_value(buffer, value, dumps):
+    """
+    Append given value of an IntervalDict to buffer.
+    """
+    if dumps is not None:
+        value = dumps(value)
+        _write_varint(buffer, len(value))
+        buffer += value
+    elif value is None:
+        buffer.append(_NONE)
+    elif value is False or value is True:
+        buffer.append(_TRUE if value else _FALSE)
+    elif type(value) is int:
+        buffer.append(_INT)
+        _write_varint(buffer, 2 * value if value >= 0 else -2 * value - 1)
+    elif type(value) is float:
+        buffer.append(_FLOAT)
+        buffer += struct.pack("<d", value)
+    elif type(value) is str or type(value) is bytes:
+        encoded = value.encode("utf-8") if type(value) is str else value
+        buffer.append(_STR if type(value) is str else _BYTES)
+        _write_varint(buffer, len(encoded))
+        buffer += encoded
+    else:
+        raise TypeError(
+            "Unsupported type {} for {}, use dumps to convert it.".format(
+                type(value), value
             )
         )
-    return data
+
+
+def _read_value(content, position, loads):
+    """
+    Read a value of an IntervalDict from content at given position.
+
+    :return: a pair (value, position after the value).
+    """
+    if loads is not None:
+        length, position = _read_varint(content, position)
+        value = content[position : position + length]
+        if len(value) < length:
+            raise ValueError("Data cannot be decoded.")
+        return loads(value), position + length
+
+    tag = content[position]
+    position = position + 1
+    if tag == _NONE:
+        return None, position
+    elif tag == _FALSE or tag == _TRUE:
+        return tag == _TRUE, position
+    elif tag == _INT:
+        value, position = _read_varint(content, position)
+        return (value >> 1 if value & 1 == 0 else -(value >> 1) - 1), position
+    elif tag == _FLOAT:
+        return struct.unpack_from("<d", content, position)[0], position + 8
+    elif tag == _STR or tag == _BYTES:
+        length, position = _read_varint(content, position)
+        value = content[position : position + length]
+        if len(value) < length:
+            raise ValueError("Data cannot be decoded.")
+        return (value.decode("utf-8") if tag == _STR else value), position + length
+    else:
+        raise ValueError("Data cannot be decoded.")
@@ -0,0 +1,123 @@
+from .const import Bound, inf
+from .interval import Interval, AbstractDiscreteInterval
+
+
+# -P.inf, to avoid creating it each time it is needed
+_generic_ninf = -inf
+
+_pinf = float("inf")
+_ninf = float("-inf")
+
+
+def _native(value):
+    """
+    Convert P.inf and -P.inf to float infinities, and leave other values as-is.
+    """
+    if value is inf:
+        return _pinf
+    elif value is _generic_ninf:
+        return _ninf
+    return value
+
+
+def _create(cls, left, lower, upper, right):
+    """
+    Create an instance of given class containing a single atomic interval,
+    whose bounds are already normalized.
+    """
+    instance = cls()
+    # Check for non-emptiness (otherwise keep instance empty)
+    if lower < upper or (
+        lower == upper and left is Bound.CLOSED and right is Bound.CLOSED
+    ):
+        instance._set_atomic(left, lower, upper, right)
+    return instance
+
+
+class FloatInterval(Interval):
+    """
+    This class represents an interval whose bounds are numbers.
+
+    Infinities are represented by float('inf') and float('-inf') instead of
+    P.inf and -P.inf, so that bounds are compared as plain numbers. P.inf and
+    -P.inf are accepted when creating intervals, and are converted.
+    """
+
+    __slots__ = ()
+
+    _inf = _pinf
+
+    @classmethod
+    def from_atomic(cls, left, lower, upper, right):
+        # Infinities (including P.inf and -P.inf) are the only non-finite bounds
+        if not _ninf < lower < _pinf:
+            left, lower = Bound.OPEN, _native(lower)
+        if not _ninf < upper < _pinf:
+            right, upper = Bound.OPEN, _native(upper)
+
+        return _create(cls, left, lower, upper, right)
+
+    @classmethod
+    def _from_sorted_atomics(cls, atomics):
+        # Atomic intervals computed by set operations are already normalized
+        if len(atomics) == 0:
+            return cls._empty()
+        return cls.from_atomics(atomics, presorted=True, disjoint=True)
+
+
+class IntInterval(AbstractDiscreteInterval):
+    """
+    This class represents a discrete interval whose bounds are integers.
+
+    Finite bounds are always closed (e.g., (0,3) is converted to [1,2]), so that
+    atomic intervals are merged with plain integer comparisons. As for
+    FloatInterval, infinities are represented by float('inf') and
+    float('-inf') instead of P.inf and -P.inf.
+    """
+
+    __slots__ = ()
+
+    _inf = _pinf
+    _step = 1
+
+    @classmethod
+    def from_atomic(cls, left, lower, upper, right):
+        if not _ninf < lower < _pinf:
+            left, lower = Bound.OPEN, _native(lower)
+        elif left is Bound.OPEN:
+            left, lower = Bound.CLOSED, lower + 1
+
+        if not _ninf < upper < _pinf:
+            right, upper = Bound.OPEN, _native(upper)
+        elif right is Bound.OPEN:
+            right, upper = Bound.CLOSED, upper - 1
+
+        return _create(cls, left, lower, upper, right)
+
+    @classmethod
+    def _mergeable(cls, a, b):
+        # Bounds are closed, unless infinite
+        if a.lower <= b.lower:
+            return a.upper + 1 >= b.lower
+        return b.upper + 1 >= a.lower
+
+    def cardinality(self):
+        """
+        Return the number of integers in current interval.
+
+        :return: a number of integers, or float('inf') if interval is unbounded.
+        """
+        if self.lower == _ninf or self.upper == _pinf:
+            return _pinf
+        return sum(i.upper - i.lower + 1 for i in self._intervals)
+
+    def to_ranges(self):
+        """
+        Return the integers in current interval as a list of range objects, one
+        for each underlying atomic interval.
+
+        :return: a list of range objects.
+        """
+        if self.lower == _ninf or self.upper == _pinf:
+            raise ValueError("An unbounded interval cannot be converted to ranges.")
+        return [range(i.lower, i.upper + 1) for i in self._intervals]
@@ -39,7 +39,8 @@ setup(
         "sortedcontainers ~= 2.2",
     ],
     extras_require={
-        "test": ["pytest ~= 7.0", "coverage ~= 6.0", "black >= 21.8b"],
+        "numpy": ["numpy"],
+        "test": ["pytest ~= 7.0", "coverage ~= 6.0", "black >= 21.8b", "numpy"],
     },
     zip_safe=True,
 )
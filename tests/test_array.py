@@ -0,0 +1,120 @@
+import pytest
+
+import portion as P
+
+numpy = pytest.importorskip('numpy')
+
+from portion.array import ArrayInterval
+
+
+A = P.create_api(ArrayInterval)
+
+
+class TestArrayInterval:
+    def test_type(self):
+        assert A.Interval == ArrayInterval
+        assert isinstance(A.closed(0, 1), ArrayInterval)
+        assert isinstance(A.closed(0, 1) | A.closed(2, 3), ArrayInterval)
+        assert isinstance(~A.closed(0, 1), ArrayInterval)
+
+    def test_creation(self):
+        assert A.closed(0, 1) == P.closed(0, 1)
+        assert A.closed(0, P.inf) == P.closedopen(0, P.inf)
+        assert A.closed(-numpy.inf, 0) == P.openclosed(-P.inf, 0)
+        assert A.open(1, 1).empty
+        assert A.closed(1, 0).empty
+        assert A.Interval(A.closed(0, 1), A.closed(1, 2), P.open(2, 3)) == P.closedopen(0, 3)
+        assert A.Interval.from_atomics([(P.CLOSED, 2, 3, P.OPEN), (P.CLOSED, 0, 2, P.CLOSED), (P.OPEN, 5, 5, P.OPEN)]) == P.closedopen(0, 3)
+
+    def test_bounds(self):
+        i = A.openclosed(0, 1) | A.closedopen(2, P.inf)
+        assert (i.left, i.lower, i.upper, i.right) == (P.OPEN, 0, P.inf, P.OPEN)
+        assert A.empty().lower == P.inf and A.empty().upper == -P.inf
+        assert i.enclosure == P.openclosed(0, P.inf)
+
+    def test_iteration(self):
+        i = A.closed(0, 1) | A.open(2, 3) | A.singleton(4)
+        assert len(i) == 3
+        assert list(i) == [P.closed(0, 1), P.open(2, 3), P.singleton(4)]
+        assert i[-1] == P.singleton(4)
+        assert i[1:] == P.open(2, 3) | P.singleton(4)
+        assert i[::-1] == i
+        with pytest.raises(IndexError):
+            i[3]
+
+    def test_operations(self):
+        i1 = A.closed(0, 2) | A.open(4, 6) | A.closed(8, P.inf)
+        i2 = A.open(1, 5) | A.singleton(8)
+        p1 = P.closed(0, 2) | P.open(4, 6) | P.closed(8, P.inf)
+        p2 = P.open(1, 5) | P.singleton(8)
+
+        assert i1 & i2 == p1 & p2
+        assert i1 | i2 == p1 | p2
+        assert i1 - i2 == p1 - p2
+        assert i2 - i1 == p2 - p1
+        assert ~i1 == ~p1
+        assert ~~i1 == i1
+        assert ~A.empty() == A.open(-P.inf, P.inf)
+        assert (~A.open(-P.inf, P.inf)).empty
+
+    def test_operations_with_intervals(self):
+        i = A.closed(0, 2) | A.closed(4, 6)
+        p = P.open(1, 5)
+        assert i & p == P.closed(0, 2) & p | P.closed(4, 6) & p
+        assert isinstance(i & p, ArrayInterval)
+        assert i | p == P.closed(0, 6)
+        assert i - p == P.closed(0, 1) | P.closed(5, 6)
+
+    def test_operations_from_intervals(self):
+        i = A.closed(0, 2) | A.closed(4, 6) | A.closed(14, 21)
+        p = P.openclosed(1, 5) | P.openclosed(12, 21)
+        assert p & i == P.openclosed(1, 2) | P.closed(4, 5) | P.closed(14, 21)
+        assert p - i == P.open(2, 4) | P.open(12, 14)
+        assert p.overlaps(i) and not P.open(2, 4).overlaps(i)
+        assert P.closed(15, 20) | P.singleton(0) in i
+        assert P.closed(15, 22) not in i
+        assert i.atomics()[1] == (P.CLOSED, 4, 6, P.CLOSED)
+
+    def test_overlaps(self):
+        assert A.closed(0, 1).overlaps(A.closed(1, 2))
+        assert not A.closed(0, 1).overlaps(A.open(1, 2))
+        assert (A.closed(0, 1) | A.closed(4, 5)).overlaps(P.open(3, 4) | P.singleton(5))
+        with pytest.raises(TypeError):
+            A.closed(0, 1).overlaps(1)
+
+    def test_containment(self):
+        i = A.closedopen(0, 1) | A.singleton(2) | A.open(3, P.inf)
+        assert [v in i for v in [-1, 0, 0.5, 1, 2, 3, 4]] == [False, True, True, False, True, False, True]
+        assert i.contains_many([-1, 0, 0.5, 1, 2, 3, 4]).tolist() == [False, True, True, False, True, False, True]
+        assert P.closed(0, 0.5) in i
+        assert A.open(3, 10) | A.singleton(0) in i
+        assert A.closed(0, 1) not in i
+        assert A.empty() in i
+
+    def test_comparisons(self):
+        assert A.closed(0, 1) < A.closed(2, 3)
+        assert A.closed(0, 1) <= A.closed(0, 2)
+        assert A.closed(0, 1) == P.closed(0, 1) and P.closed(0, 1) == A.closed(0, 1)
+        assert A.closed(0, 1) != A.closedopen(0, 1)
+        assert hash(A.closed(0, 1)) == hash(P.closed(0, 1))
+        assert hash(A.closed(0, 1) | A.closed(2, 3)) == hash(P.closed(0, 1) | P.closed(2, 3))
+
+    def test_pickle(self):
+        import pickle
+
+        for i in [A.empty(), A.closed(0, 1), A.closed(0, 1) | A.open(2, P.inf)]:
+            assert pickle.loads(pickle.dumps(i)) == i
+
+    def test_api(self):
+        assert A.from_string('[0,1] | (2,+inf)', conv=float) == P.closed(0, 1) | P.open(2, P.inf)
+        assert A.to_string(A.closedopen(0, P.inf)) == '[0.0,+inf)'
+        assert A.from_data(A.to_data(A.closed(0, 1) | A.open(2, P.inf))) == P.closed(0, 1) | P.open(2, P.inf)
+        assert A.closed(0, 4).replace(upper=2, right=P.OPEN) == P.closedopen(0, 2)
+        assert list(A.iterate(A.closed(0, 2), step=1)) == [0, 1, 2]
+
+    def test_dict(self):
+        d = A.IntervalDict()
+        d[A.closed(0, 3)] = 'a'
+        d[A.closed(2, 5)] = 'b'
+        assert d[1] == 'a' and d[2.5] == 'b'
+        assert d.domain() == P.closed(0, 5)
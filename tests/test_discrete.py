@@ -60,6 +60,32 @@ class TestIntInterval:
         assert D.singleton(1).adjacent(D.singleton(2))
         assert not D.singleton(1).adjacent(D.singleton(3))
 
+    def test_complement_and_difference(self):
+        assert ~D.closed(0, 2) == D.closed(-D.inf, -1) | D.closed(3, D.inf)
+        assert ~(D.singleton(0) | D.singleton(2)) == D.closed(-D.inf, -1) | D.singleton(1) | D.closed(3, D.inf)
+        assert D.closed(0, 5) - D.singleton(2) == D.closed(0, 1) | D.closed(3, 5)
+        assert D.closed(0, 5) - D.open(1, 3) == D.closed(0, 1) | D.closed(3, 5)
+        assert D.closed(0, 5) - D.closed(1, 4) == D.singleton(0) | D.singleton(5)
+
+    def test_intersection_with_interval(self):
+        # Bounds of a plain Interval are normalized w.r.t. the discrete class
+        assert D.closed(5, 20) & P.open(0, 10) == D.closed(5, 9)
+        assert str(D.closed(5, 20) & P.open(0, 10)) == '[5,9]'
+        assert (D.closed(5, 20) | D.closed(30, 40)) & P.open(0, 35) == D.closed(5, 20) | D.closed(30, 34)
+        assert str((D.closed(5, 20) | D.closed(30, 40)) & P.open(0, 35)) == '[5,20] | [30,34]'
+        assert D.closed(5, 20) & P.open(9, 10) == D.empty()
+        assert (D.closed(5, 20) & P.open(0, 10)) - D.closed(9, 20) == (D.closed(5, 20) - D.closed(9, 20)) & P.open(0, 10)
+
+    def test_relation(self):
+        assert D.closed(0, 1).relation(D.closed(2, 3)) == P.Relation.MEETS
+        assert D.closed(0, 1).relation(D.closed(3, 4)) == P.Relation.BEFORE
+        assert D.closed(2, 3).relation(D.open(0, 2)) == P.Relation.MET_BY
+
+    def test_union_all_and_intersection_all(self):
+        assert D.Interval.union_all([D.singleton(0), D.singleton(2), D.singleton(1)]) == D.closed(0, 2)
+        assert D.Interval.intersection_all([D.closed(0, 5), D.open(0, 6)]) == D.closed(1, 5)
+        assert D.Interval.intersection_all([]) == D.closed(-D.inf, D.inf)
+
 
 class TestCharInterval:
     # Most of the behaviour is already covered by TestIntInterval.
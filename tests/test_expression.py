@@ -0,0 +1,79 @@
+import pytest
+
+import portion as P
+
+
+class IntInterval(P.AbstractDiscreteInterval):
+    _step = 1
+
+
+D = P.create_api(IntInterval)
+
+
+class TestExpression:
+    def test_evaluate(self):
+        a, b = P.closed(0, 4), P.open(3, 8)
+        c, d = P.closed(2, 5) | P.singleton(7), P.closedopen(0, 1)
+        assert P.lazy(a).evaluate() == a
+        assert (P.lazy(a) | b).evaluate() == a | b
+        assert (P.lazy(a) & b).evaluate() == a & b
+        assert (P.lazy(a) - b).evaluate() == a - b
+        assert (~P.lazy(a)).evaluate() == ~a
+        assert ((P.lazy(a) | b) & ~P.lazy(c) - d).evaluate() == (a | b) & ~c - d
+
+    def test_evaluate_with_intervals(self):
+        a, b = P.closed(0, 4), P.open(3, 8)
+        assert (a | P.lazy(b)).evaluate() == a | b
+        assert (a & P.lazy(b)).evaluate() == a & b
+        assert (a - P.lazy(b)).evaluate() == a - b
+        assert (b - P.lazy(a)).evaluate() == b - a
+
+    def test_evaluate_with_same_operands(self):
+        a = P.closed(0, 1) | P.open(2, 3)
+        assert (P.lazy(a) | a).evaluate() == a
+        assert (P.lazy(a) & a).evaluate() == a
+        assert (P.lazy(a) - a).evaluate() == P.empty()
+        assert (P.lazy(a) | ~P.lazy(a)).evaluate() == P.open(-P.inf, P.inf)
+
+    def test_evaluate_with_bounds(self):
+        assert (P.lazy(P.closed(0, 1)) & P.closed(1, 2)).evaluate() == P.singleton(1)
+        assert (P.lazy(P.closedopen(0, 1)) & P.closed(1, 2)).evaluate() == P.empty()
+        assert (P.lazy(P.closedopen(0, 1)) | P.openclosed(1, 2)).evaluate() == P.closedopen(0, 1) | P.openclosed(1, 2)
+        assert (P.lazy(P.closed(0, 2)) - P.singleton(1)).evaluate() == P.closedopen(0, 1) | P.openclosed(1, 2)
+        assert (~P.lazy(P.open(-P.inf, 0))).evaluate() == P.closedopen(0, P.inf)
+        assert (~P.lazy(P.empty())).evaluate() == P.open(-P.inf, P.inf)
+        assert (~P.lazy(P.open(-P.inf, P.inf))).evaluate() == P.empty()
+
+    def test_evaluate_with_many_operands(self):
+        intervals = [P.closed(i, i + 3) for i in range(0, 40, 2)]
+        expression, expected = P.lazy(intervals[0]), intervals[0]
+        for i, interval in enumerate(intervals[1:]):
+            if i % 3 == 0:
+                expression, expected = expression - interval, expected - interval
+            else:
+                expression, expected = expression | interval, expected | interval
+        assert expression.evaluate() == expected
+
+    def test_evaluate_with_discrete_intervals(self):
+        a, b = D.closed(0, 5), D.singleton(2)
+        assert (D.lazy(a) - b).evaluate() == D.closed(0, 1) | D.closed(3, 5)
+        assert (D.lazy(D.closed(0, 1)) | D.singleton(2)).evaluate() == D.closed(0, 2)
+        assert (~D.lazy(a)).evaluate() == ~a
+        assert isinstance((~D.lazy(a)).evaluate(), D.Interval)
+
+    def test_evaluate_with_klass(self):
+        result = (P.lazy(P.closed(0, 1)) | P.singleton(2)).evaluate(klass=D.Interval)
+        assert result == D.closed(0, 2)
+        assert isinstance(result, D.Interval)
+
+    def test_repr(self):
+        assert repr(P.lazy(P.closed(0, 1))) == 'lazy([0,1])'
+        assert repr(~P.lazy(P.closed(0, 1)) & P.open(2, 3)) == '(~lazy([0,1]) & lazy((2,3)))'
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.lazy(1)
+        with pytest.raises(TypeError):
+            P.lazy(P.closed(0, 1)) | 1
+        with pytest.raises(TypeError):
+            1 & P.lazy(P.closed(0, 1))
@@ -54,3 +54,125 @@ class TestIterate:
         assert next(gen) == 0
         assert next(gen) == -1
         assert next(gen) == -2  # and so on
+
+
+class TestIterateChunks:
+    def test_integers(self):
+        assert list(P.iterate_chunks(P.closed(0, 2), step=1)) == [range(0, 3)]
+        assert list(P.iterate_chunks(P.open(0, 2.5), step=1)) == [range(1, 3)]
+        assert list(P.iterate_chunks(P.closed(0, 2) | P.open(4, 8), step=2)) == [range(0, 4, 2), range(6, 8, 2)]
+        assert list(P.iterate_chunks(P.empty(), step=1)) == []
+        assert list(P.iterate_chunks(P.open(0, 1), step=1)) == []
+
+    def test_floats(self):
+        numpy = pytest.importorskip('numpy')
+        chunks = list(P.iterate_chunks(P.closed(0, 1) | P.closedopen(2, 3), step=0.5))
+        assert all(isinstance(chunk, numpy.ndarray) for chunk in chunks)
+        assert [chunk.tolist() for chunk in chunks] == [[0, 0.5, 1], [2, 2.5]]
+
+    def test_floats_without_numpy(self, monkeypatch):
+        import builtins
+
+        original_import = builtins.__import__
+
+        def no_numpy(name, *args, **kwargs):
+            if name == 'numpy':
+                raise ImportError
+            return original_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, '__import__', no_numpy)
+        assert list(P.iterate_chunks(P.closed(0, 1), step=0.5)) == [[0, 0.5, 1]]
+
+    def test_same_values_as_iterate(self):
+        interval = P.closed(0, 10) | P.open(20, 30) | P.openclosed(40, 45)
+        for step in [1, 3, 7]:
+            for base in [None, lambda x: 0, lambda x: x - 1]:
+                expected = list(P.iterate(interval, step=step, base=base))
+                chunks = P.iterate_chunks(interval, step=step, base=base)
+                assert [v for chunk in chunks for v in chunk] == expected
+
+                expected = list(P.iterate(interval, step=-step, base=base, reverse=True))
+                chunks = P.iterate_chunks(interval, step=-step, base=base, reverse=True)
+                assert [v for chunk in chunks for v in chunk] == expected
+
+    def test_chunk_size(self):
+        chunks = P.iterate_chunks(P.closed(0, 4) | P.singleton(10), step=1, chunk_size=2)
+        assert list(chunks) == [range(0, 2), range(2, 4), range(4, 5), range(10, 11)]
+
+    def test_open_intervals(self):
+        gen = P.iterate_chunks(P.closedopen(0, P.inf), step=1, chunk_size=3)
+        assert next(gen) == range(0, 3)
+        assert next(gen) == range(3, 6)
+
+        gen = P.iterate_chunks(P.openclosed(-P.inf, 0), step=-1, reverse=True, chunk_size=2)
+        assert next(gen) == range(0, -2, -1)
+
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.closedopen(0, P.inf), step=1))
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.openclosed(-P.inf, 0), step=1, chunk_size=2))
+
+    def test_invalid_parameters(self):
+        with pytest.raises(TypeError):
+            list(P.iterate_chunks(P.closed(0, 1), step=lambda x: x + 1))
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.closed(0, 1), step=-1))
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.closed(0, 1), step=1, reverse=True))
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.closed(0, 1), step=0))
+        with pytest.raises(ValueError):
+            list(P.iterate_chunks(P.closed(0, 1), step=1, chunk_size=0))
+
+    def test_with_float_infinities(self):
+        F = P.create_api(P.FloatInterval)
+        with pytest.raises(ValueError):
+            next(P.iterate(F.openclosed(-F.inf, 0), step=1))
+        with pytest.raises(ValueError):
+            next(P.iterate_chunks(F.openclosed(-F.inf, 0), step=1, chunk_size=1))
+        assert next(P.iterate_chunks(F.closedopen(0, F.inf), step=1, chunk_size=2)) == range(0, 2)
+
+
+class TestOverlapJoin:
+    def test_join(self):
+        left = [(P.closed(0, 2), 'a'), (P.open(3, 5), 'b'), (P.closed(10, 12), 'c')]
+        right = [(P.closed(2, 3), 'x'), (P.closed(4, 11), 'y'), (P.closed(20, 30), 'z')]
+        pairs = sorted((l[1], r[1]) for l, r in P.overlap_join(left, right))
+        assert pairs == [('a', 'x'), ('b', 'y'), ('c', 'y')]
+
+    def test_join_with_bounds(self):
+        left = [(P.closedopen(0, 1), 'a'), (P.closed(5, 6), 'b')]
+        right = [(P.closed(1, 2), 'x'), (P.openclosed(6, 7), 'y'), (P.closed(6, 6), 'z')]
+        pairs = sorted((l[1], r[1]) for l, r in P.overlap_join(left, right))
+        assert pairs == [('b', 'z')]
+
+    def test_join_with_unions_and_infinities(self):
+        left = [(P.closed(0, 1) | P.closed(5, 6), 'a'), (P.closed(-P.inf, 0), 'b')]
+        right = [(P.open(1, 5), 'x'), (P.closed(6, P.inf), 'y'), (P.empty(), 'z')]
+        pairs = sorted((l[1], r[1]) for l, r in P.overlap_join(left, right))
+        assert pairs == [('a', 'y')]
+
+    def test_join_with_intersection(self):
+        left = [(P.closed(0, 5), 'a')]
+        right = [(P.open(3, 8), 'x'), (P.closed(5, 6), 'y')]
+        results = sorted((l[1], r[1], i) for l, r, i in P.overlap_join(left, right, intersection=True))
+        assert results == [('a', 'x', P.openclosed(3, 5)), ('a', 'y', P.singleton(5))]
+
+    def test_join_with_presorted(self):
+        left = ((P.closed(i, i + 2), i) for i in range(0, 10, 3))
+        right = ((P.closed(i, i + 1), i) for i in range(1, 10, 4))
+        pairs = list(P.overlap_join(left, right, presorted=True))
+        assert sorted((l[1], r[1]) for l, r in pairs) == [(0, 1), (3, 5), (6, 5), (9, 9)]
+
+        with pytest.raises(ValueError):
+            list(P.overlap_join([(P.closed(2, 3), 0), (P.closed(0, 1), 1)], [], presorted=True))
+
+    def test_join_with_many_intervals(self):
+        left = [(P.closed(i, i + 3), i) for i in range(100)]
+        right = [(P.closed(i, i), i) for i in range(0, 100, 7)]
+        pairs = sorted((l[1], r[1]) for l, r in P.overlap_join(left, right))
+        assert pairs == sorted((l[1], r[1]) for l in left for r in right if l[0].overlaps(r[0]))
+
+    def test_join_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            list(P.overlap_join([(1, 'a')], []))
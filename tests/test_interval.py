@@ -62,6 +62,24 @@ class TestInterval:
         with pytest.raises(TypeError):
             P.Interval(1)
 
+    def test_creation_with_many_overlaps(self):
+        intervals = [P.closed(i, i + 2) for i in range(0, 1000, 2)]
+        assert P.Interval(*intervals) == P.closed(0, 1000)
+        assert P.Interval(*reversed(intervals)) == P.closed(0, 1000)
+        assert P.Interval(*[P.open(i, i + 1) for i in range(10)]) == P.Interval(*[P.open(i, i + 1) for i in reversed(range(10))])
+
+    def test_from_atomics(self):
+        atomics = [(P.CLOSED, 3, 4, P.OPEN), (P.CLOSED, 0, 1, P.CLOSED), (P.OPEN, 1, 2, P.OPEN)]
+        assert P.Interval.from_atomics(atomics) == P.closed(0, 2) - P.singleton(2) | P.closedopen(3, 4)
+        assert P.Interval.from_atomics([]) == P.empty()
+        assert P.Interval.from_atomics(sorted(atomics, key=lambda a: a[1]), presorted=True) == P.closedopen(0, 2) | P.closedopen(3, 4)
+
+    def test_from_atomics_trusted(self):
+        i = P.closed(0, 1) | P.open(2, 3) | P.singleton(4)
+        assert P.Interval.from_atomics(list(i._intervals), presorted=True, disjoint=True) == i
+        assert P.Interval.from_atomics(reversed(i._intervals), disjoint=True) == i
+        assert P.Interval.from_atomics([tuple(a) for a in i._intervals], presorted=True, disjoint=True) == i
+
     def test_creation_issue_19(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/19
         assert P.Interval(P.empty(), P.empty()) == P.empty()
@@ -135,8 +153,74 @@ class TestInterval:
         with pytest.raises(TypeError):
             hash(P.closed(-1, 0) | x)
 
-        # Not guaranteed to work
-        assert hash(P.closed(-1, 0) | x | P.closed(3, 4)) is not None
+        with pytest.raises(TypeError):
+            hash(P.closed(-1, 0) | x | P.closed(3, 4))
+
+    def test_hash_with_content(self):
+        assert hash(P.closed(0, 1)) == hash(P.closed(0, 1))
+        assert hash(P.closed(0, 1)) == hash(P.closed(0.0, 1.0))
+        assert hash(P.closed(0, 3)) != hash(P.closed(0, 1) | P.closed(2, 3))
+        assert hash(P.closed(0, 1)) != hash(P.closedopen(0, 1))
+        assert hash(P.open(-P.inf, P.inf)) == hash(P.closed(-P.inf, P.inf))
+        assert len({P.closed(0, 3), P.closed(0, 1) | P.closed(2, 3), P.closed(0, 3)}) == 2
+
+    def test_intern(self):
+        i1 = P.closed(0, 1) | P.open(2, 3)
+        i2 = P.open(2, 3) | P.closed(0, 1)
+        assert i1 is not i2
+        assert i1.intern() is i1
+        assert i2.intern() is i1
+        assert P.closed(0, 1).intern() is not i1
+        assert P.closed(0, 1).intern() == P.closed(0, 1)
+
+    def test_intern_is_weak(self):
+        import gc
+
+        i1 = P.closed(0, 1000).intern()
+        assert P.closed(0.0, 1000.0).intern() is i1
+        del i1
+        gc.collect()
+        i2 = P.closed(0.0, 1000.0)
+        assert i2.intern() is i2
+
+    def test_shared_empty(self):
+        assert P.empty() is P.empty()
+        assert P.closed(0, 1) & P.closed(2, 3) is P.empty()
+        assert P.closed(0, 1) - P.closed(0, 2) is P.empty()
+        assert (P.closed(0, 1) | P.closed(2, 3)) & P.open(1, 2) is P.empty()
+        assert P.Interval() is not P.empty()
+
+    def test_compact_storage(self):
+        for i in [P.empty(), P.closed(0, 1), P.openclosed(-P.inf, 0), P.closed(0, 1) | P.open(2, 3)]:
+            assert not hasattr(i, '__dict__')
+            assert P.Interval.from_atomics(i.atomics()) == i
+            assert P.Interval(*i) == i
+
+        i = P.closedopen(0, 1)
+        assert (i.left, i.lower, i.upper, i.right) == (P.CLOSED, 0, 1, P.OPEN)
+        assert i.atomics()[0] == (P.CLOSED, 0, 1, P.OPEN)
+
+    def test_pickle(self):
+        import copy
+        import pickle
+
+        for i in [P.empty(), P.singleton(0), P.open(-P.inf, 0), P.closed(0, 1) | P.open(2, 3)]:
+            assert pickle.loads(pickle.dumps(i)) == i
+            assert copy.deepcopy(i) == i
+            assert hash(pickle.loads(pickle.dumps(i))) == hash(i)
+
+    def test_pickle_without_cache(self):
+        import pickle
+
+        # Hash values of strings differ between processes, and must not be pickled
+        i = P.closed('a', 'b') | P.closed('c', 'd')
+        hash(i)
+        assert 'b' in i
+        assert hasattr(i, '_cache')
+        j = pickle.loads(pickle.dumps(i))
+        assert not hasattr(j, '_cache')
+        assert j == i and hash(j) == hash(i)
+        assert j.atomics() == i.atomics()
 
     def test_enclosure(self):
         assert P.closed(0, 1) == P.closed(0, 1).enclosure
@@ -144,6 +228,77 @@ class TestInterval:
         assert P.closed(0, 4) == (P.closed(0, 1) | P.closed(3, 4)).enclosure
         assert P.openclosed(0, 4) == (P.open(0, 1) | P.closed(3, 4)).enclosure
 
+    def test_bound_key(self):
+        from fractions import Fraction
+
+        class FractionInterval(P.Interval):
+            _bound_key = staticmethod(lambda value: int(value * 4))
+
+        F = P.create_api(FractionInterval)
+        q = Fraction(1, 4)
+        intervals = [F.closed(2 * q, 3 * q), F.open(-P.inf, q), F.openclosed(q, 2 * q), F.closedopen(q, 2 * q), F.closed(5 * q, P.inf)]
+        expected = P.openclosed(-P.inf, 3 * q) | P.closed(5 * q, P.inf)
+        assert F.Interval(*intervals) == expected
+        assert F.Interval.union_all(intervals) == expected
+        assert F.Interval.from_atomics([a for i in intervals for a in i.atomics()]) == expected
+        assert F.Interval.intersection_all([F.closed(0, 1), F.open(q, P.inf), F.closedopen(-P.inf, 3 * q)]) == P.open(q, 3 * q)
+        assert F.Interval.intersection_all([F.closed(0, q), F.openclosed(q, 1)]) == F.empty()
+        assert (P.lazy(F.closed(0, q)) | F.openclosed(q, 1) - F.singleton(2 * q)).evaluate() == P.closed(0, 1) - P.singleton(2 * q)
+
+    def test_bound_key_with_float_infinities(self):
+        class QuarterInterval(P.FloatInterval):
+            _bound_key = staticmethod(lambda value: int(value * 4))
+
+        Q = P.create_api(QuarterInterval)
+        intervals = [Q.Interval.from_atomic(P.OPEN, -P.inf, 1, P.CLOSED), Q.closed(0.5, 3), Q.open(4, float('inf'))]
+        expected = Q.openclosed(-P.inf, 3) | Q.open(4, P.inf)
+        assert Q.Interval(*intervals) == expected
+        assert Q.Interval.union_all(intervals) == expected
+        assert Q.Interval.from_atomics([a for i in intervals for a in i.atomics()]) == expected
+        assert Q.Interval.intersection_all([Q.open(-float('inf'), 2), Q.closed(1, float('inf'))]) == Q.closedopen(1, 2)
+        assert (P.lazy(intervals[0]) | intervals[1] | intervals[2]).evaluate() == expected
+        assert (P.lazy(intervals[0]) & Q.closed(0.5, float('inf'))).evaluate() == Q.closed(0.5, 1)
+
+    def test_measure(self):
+        assert P.closed(0, 1).measure() == 1
+        assert (P.closed(0, 10) | P.open(20, 30) | P.singleton(40)).measure() == 20
+        assert P.singleton(1).measure() == 0
+        assert P.empty().measure() == 0
+        assert P.closed(0, P.inf).measure() == P.inf
+        assert (P.closed(-P.inf, 0) | P.closed(2, 3)).measure() == P.inf
+
+    def test_measure_within(self):
+        i = P.closed(0, 10) | P.open(20, 30) | P.singleton(40)
+        assert i.measure(within=P.closed(5, 25)) == 10
+        assert i.measure(within=P.open(0, 100)) == 20
+        assert i.measure(within=P.closed(11, 19)) == 0
+        assert i.measure(within=P.closed(-10, -5)) == 0
+        assert i.measure(within=P.singleton(5)) == 0
+        assert i.measure(within=P.closed(0, 2) | P.closed(9, 21)) == 4
+        assert i.measure(within=P.empty()) == 0
+        assert P.empty().measure(within=P.closed(0, 1)) == 0
+        assert i.measure(within=P.open(-P.inf, P.inf)) == 20
+
+    def test_measure_within_with_infinities(self):
+        i = P.closed(-P.inf, 0) | P.closed(2, 3) | P.closed(5, P.inf)
+        assert i.measure(within=P.closed(-2, 10)) == 8
+        assert i.measure(within=P.closed(1, 4)) == 1
+        assert i.measure(within=P.closed(6, P.inf)) == P.inf
+        assert i.measure(within=P.closed(-P.inf, 1)) == P.inf
+
+    def test_measure_with_datetimes(self):
+        from datetime import datetime, timedelta
+
+        start, hour = datetime(2024, 1, 1), timedelta(hours=1)
+        i = P.closed(start, start + hour) | P.closed(start + 3 * hour, P.inf)
+        assert i[0].measure() == hour
+        assert i.measure(within=P.closed(start, start + 4 * hour)) == 2 * hour
+        assert i.measure(within=P.closed(start + 2 * hour, start + 2 * hour)) == timedelta(0)
+
+    def test_measure_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.closed(0, 1).measure(within=1)
+
 
 class TestIntervalReplace:
     def test_replace_bounds(self):
@@ -280,6 +435,73 @@ class TestIntervalAdjacent():
         assert not (P.closed(0, 1) | P.closed(2, 3)).adjacent(P.closed(1, 2))
         assert (P.closedopen(0, 1) | P.openclosed(2, 3)).adjacent(P.open(-1, 0) | P.closed(1, 2) | P.openclosed(3, 4))
 
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.closed(0, 1).adjacent(1)
+
+
+class TestIntervalRelation:
+    def test_disjoint(self):
+        assert P.closed(0, 1).relation(P.closed(2, 3)) == P.Relation.BEFORE
+        assert P.closed(2, 3).relation(P.closed(0, 1)) == P.Relation.AFTER
+        assert P.closedopen(0, 1).relation(P.openclosed(1, 2)) == P.Relation.BEFORE
+        assert P.closedopen(0, 1).relation(P.closed(1, 2)) == P.Relation.MEETS
+        assert P.closed(0, 1).relation(P.openclosed(1, 2)) == P.Relation.MEETS
+        assert P.closed(1, 2).relation(P.closedopen(0, 1)) == P.Relation.MET_BY
+        assert P.closed(-P.inf, 0).relation(P.open(0, P.inf)) == P.Relation.MEETS
+
+    def test_overlapping(self):
+        assert P.closed(0, 1).relation(P.closed(1, 2)) == P.Relation.OVERLAPS
+        assert P.closed(0, 2).relation(P.closed(1, 3)) == P.Relation.OVERLAPS
+        assert P.closed(1, 3).relation(P.closed(0, 2)) == P.Relation.OVERLAPPED_BY
+        assert P.closed(0, 1).relation(P.closed(0, 2)) == P.Relation.STARTS
+        assert P.closed(0, 2).relation(P.closed(0, 1)) == P.Relation.STARTED_BY
+        assert P.closed(1, 2).relation(P.closed(0, 2)) == P.Relation.FINISHES
+        assert P.closed(0, 2).relation(P.closed(1, 2)) == P.Relation.FINISHED_BY
+        assert P.closed(1, 2).relation(P.closed(0, 3)) == P.Relation.DURING
+        assert P.closed(0, 3).relation(P.closed(1, 2)) == P.Relation.CONTAINS
+        assert P.closed(0, 1).relation(P.closed(0, 1)) == P.Relation.EQUALS
+
+    def test_with_bounds(self):
+        assert P.open(0, 1).relation(P.closed(0, 1)) == P.Relation.DURING
+        assert P.closedopen(0, 1).relation(P.closed(0, 1)) == P.Relation.STARTS
+        assert P.openclosed(0, 1).relation(P.closed(0, 1)) == P.Relation.FINISHES
+        assert P.closed(0, 1).relation(P.open(0, 1)) == P.Relation.CONTAINS
+        assert P.closed(0, P.inf).relation(P.open(0, P.inf)) == P.Relation.FINISHED_BY
+
+    def test_nonatomic(self):
+        i = P.closed(0, 1) | P.closed(4, 5)
+        assert i.relation(P.closed(2, 3)) == P.Relation.CONTAINS
+        assert i.relation(P.open(5, 6)) == P.Relation.MEETS
+        assert i.relation(P.closed(6, 7) | P.closed(8, 9)) == P.Relation.BEFORE
+        assert P.closed(-1, 0).relation(i) == P.Relation.OVERLAPS
+
+    def test_converse(self):
+        for relation in P.Relation:
+            assert ~~relation == relation
+        assert ~P.Relation.BEFORE == P.Relation.AFTER
+        assert ~P.Relation.DURING == P.Relation.CONTAINS
+        assert ~P.Relation.EQUALS == P.Relation.EQUALS
+
+    def test_relations(self):
+        intervals = [P.closed(0, 1), P.closed(1, 2), P.open(2, 3), P.closed(5, 6), P.closed(1, 6)]
+        assert P.relations(intervals, P.closed(1, 3)) == [i.relation(P.closed(1, 3)) for i in intervals]
+        assert P.relations([], P.closed(1, 3)) == []
+
+    def test_with_empty_and_invalid_types(self):
+        with pytest.raises(ValueError):
+            P.empty().relation(P.closed(0, 1))
+        with pytest.raises(ValueError):
+            P.closed(0, 1).relation(P.empty())
+        with pytest.raises(ValueError):
+            P.relations([P.empty()], P.closed(0, 1))
+        with pytest.raises(ValueError):
+            P.relations([P.closed(0, 1)], P.empty())
+        with pytest.raises(TypeError):
+            P.closed(0, 1).relation(1)
+        with pytest.raises(TypeError):
+            P.relations([1], P.closed(0, 1))
+
 
 class TestIntervalOverlaps():
     def test_overlaps(self):
@@ -292,6 +514,13 @@ class TestIntervalOverlaps():
         assert not P.closed(0, 1).overlaps(P.closed(3, 4))
         assert not P.closed(3, 4).overlaps(P.closed(0, 1))
 
+    def test_overlaps_with_large_interval(self):
+        large = P.Interval(*[P.closed(i, i + 0.5) for i in range(100)])
+        assert large.overlaps(P.closed(0.7, 0.9) | P.closed(50.5, 51))
+        assert P.singleton(99.5).overlaps(large)
+        assert not large.overlaps(P.open(10.5, 11) | P.closed(70.6, 70.9))
+        assert not (P.open(10.5, 11) | P.closed(70.6, 70.9)).overlaps(large)
+
     def test_overlaps_with_edge_cases(self):
         assert not P.closed(0, 1).overlaps(P.open(1, 2))
         assert not P.closed(0, 1).overlaps(P.openclosed(1, 2))
@@ -481,6 +710,62 @@ class TestIntervalContainment:
         assert 7 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
         assert 11 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
 
+    def test_with_values_and_many_atomics(self):
+        i = P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 200, 2)])
+        for x in range(-2, 202):
+            assert (x in i) == (x % 2 == 0 and 0 <= x < 200)
+            assert (x + 0.5 in i) == (x % 2 == 0 and 0 <= x < 200)
+
+        i = P.openclosed(-P.inf, 0) | P.open(1, 2) | P.singleton(3) | P.open(4, P.inf)
+        assert [x in i for x in range(-1, 7)] == [True, True, False, False, True, False, True, True]
+
+    def test_contains_many(self):
+        numpy = pytest.importorskip('numpy')
+
+        i = P.closedopen(0, 1) | P.open(2, 3) | P.singleton(4) | P.closed(5, P.inf)
+        values = [-1, 0, 0.5, 1, 2, 2.5, 3, 4, 4.5, 5, 10**9, numpy.inf, numpy.nan]
+        expected = [v in i for v in values]
+        assert expected == [False, True, True, False, False, True, False, True, False, True, True, True, False]
+        assert i.contains_many(values).tolist() == expected
+        assert i.contains_many(numpy.array(values)).tolist() == expected
+        assert i.contains_many(numpy.arange(6).reshape(2, 3)).tolist() == [[True, False, False], [False, True, True]]
+
+        assert P.empty().contains_many([0, 1]).tolist() == [False, False]
+        assert P.open(-P.inf, P.inf).contains_many([0, 1]).tolist() == [True, True]
+
+    def test_contains_many_with_large_integers(self):
+        numpy = pytest.importorskip('numpy')
+
+        t = 1_700_000_000_000_000_001
+        values = numpy.array([t - 1, t, t + 10, t + 11, t + 20, t + 21])
+        i = P.open(-P.inf, 0) | P.closed(t, t + 10)
+        assert i.contains_many(values).tolist() == [False, True, True, False, False, False]
+        assert i.contains_many(values).tolist() == [int(v) in i for v in values]
+
+        i = P.closed(t, t + 10) | P.open(t + 20, P.inf)
+        assert i.contains_many(values).tolist() == [False, True, True, False, False, True]
+
+        i = P.open(-float('inf'), 0, klass=P.FloatInterval) | P.closed(t, float('inf'), klass=P.FloatInterval)
+        assert i.contains_many(values).tolist() == [False, True, True, True, True, True]
+        assert i.contains_many([-1, 0]).tolist() == [True, False]
+
+    def test_contains_many_with_non_numeric_values(self):
+        pytest.importorskip('numpy')
+
+        i = P.closed('a', 'c') | P.openclosed('e', 'g')
+        assert i.contains_many(['a', 'b', 'd', 'e', 'f']).tolist() == [True, True, False, False, True]
+
+        import datetime
+        d1, d2 = datetime.date(2020, 1, 1), datetime.date(2020, 2, 1)
+        assert P.closedopen(d1, d2).contains_many([d1, d2]).tolist() == [True, False]
+
+    def test_contains_many_without_numpy(self, monkeypatch):
+        import sys
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+        i = P.closedopen(0, 1) | P.singleton(2)
+        assert i.contains_many([0, 1, 2, 3]) == [True, False, True, False]
+
     def test_with_infinities(self):
         assert 1 in P.closed(-P.inf, P.inf)
         assert 1 in P.closed(-P.inf, 1)
@@ -521,6 +806,13 @@ class TestIntervalContainment:
         assert P.closed(0, 1) | P.closed(2, 3) not in P.closed(0, 1) | P.closedopen(2, 3)
         assert P.closed(0, 1) | P.closed(2, 3) not in P.closed(0, 1) | P.closedopen(2, 3) | P.openclosed(3, 4)
 
+    def test_with_large_interval(self):
+        large = P.Interval(*[P.closed(i, i + 0.5) for i in range(100)])
+        assert P.closed(10, 10.5) | P.open(50, 50.5) | P.singleton(99.5) in large
+        assert P.closed(10, 10.5) | P.closed(50.2, 51) not in large
+        assert P.closed(10, 10.5) | P.singleton(100) not in large
+        assert P.singleton(-1) | P.closed(10, 10.5) not in large
+
     def test_with_empty_intervals(self):
         assert P.empty() in P.closed(0, 3)
         assert P.empty() in P.empty()
@@ -564,6 +856,14 @@ class TestIntervalIntersection:
         assert (P.closed(0, 2) | P.closed(4, 6)) & (P.closed(-1, 1) | P.closed(3, 6)) == P.closed(0, 1) | P.closed(4, 6)
         assert (P.closed(0, 2) | P.closed(4, 6)) & (P.closed(1, 4) | P.singleton(5)) == P.closed(1, 2) | P.singleton(4) | P.singleton(5)
 
+    def test_with_large_interval(self):
+        large = P.Interval(*[P.closed(i, i + 0.5) for i in range(100)])
+        small = P.closed(10.2, 11) | P.open(50.5, 52) | P.closed(98, 99.2)
+        expected = P.closed(10.2, 10.5) | P.singleton(11) | P.closed(51, 51.5) | P.closed(98, 98.5) | P.closed(99, 99.2)
+        assert large & small == expected
+        assert small & large == expected
+        assert large & P.open(10.5, 11) == P.empty()
+
     def test_empty(self):
         assert (P.closed(0, 1) & P.closed(2, 3)).empty
         assert P.closed(0, 1) & P.empty() == P.empty()
@@ -576,6 +876,44 @@ class TestIntervalIntersection:
         with pytest.raises(TypeError):
             P.closed(0, 1) & 1
 
+    def test_intersection_all(self):
+        i1 = P.closed(0, 4) | P.closed(6, 10)
+        i2 = P.open(1, 7) | P.closedopen(8, 12)
+        i3 = P.closed(2, 9)
+        assert P.Interval.intersection_all([i1, i2, i3]) == i1 & i2 & i3
+        assert P.Interval.intersection_all(iter([i1, i2])) == i1 & i2
+        assert P.Interval.intersection_all([i1]) == i1
+        assert P.Interval.intersection_all([P.closed(0, 1), P.closed(1, 2)]) == P.singleton(1)
+        assert P.Interval.intersection_all([P.closedopen(0, 1), P.closed(1, 2)]).empty
+        assert P.Interval.intersection_all([i1, P.empty(), i2]).empty
+        assert P.Interval.intersection_all([]) == P.open(-P.inf, P.inf)
+
+        with pytest.raises(TypeError):
+            P.Interval.intersection_all([i1, 1])
+
+    def test_clip(self):
+        i = P.closed(0, 2) | P.open(4, 6) | P.singleton(8) | P.closed(10, P.inf)
+        assert i.clip(1, 5) == P.closed(1, 2) | P.openclosed(4, 5)
+        assert i.clip(2, 4) == P.singleton(2)
+        assert i.clip(2, 4, left=P.OPEN) == P.empty()
+        assert i.clip(5, 8, right=P.OPEN) == P.closedopen(5, 6)
+        assert i.clip(3, 3.5) == P.empty()
+        assert i.clip(-P.inf, P.inf) == i
+        assert i.clip(9, P.inf) == P.closed(10, P.inf)
+        assert i.clip(2, 1) == P.empty()
+        assert P.closed(0, 1).clip(0.5, 2) == P.closed(0.5, 1)
+        assert P.empty().clip(0, 1) == P.empty()
+
+        for lower, upper in [(-1, 1), (1, 9), (4, 6), (6, 10), (-P.inf, 5)]:
+            assert i.clip(lower, upper) == i & P.closed(lower, upper)
+
+    def test_window(self):
+        i = P.closed(0, 2) | P.open(4, 6) | P.singleton(8)
+        assert list(i.window(1, 5)) == [(P.CLOSED, 1, 2, P.CLOSED), (P.OPEN, 4, 5, P.CLOSED)]
+        assert len(i.window(7, 9)) == 1
+        assert len(i.window(3, 4)) == 0
+        assert i.window(-P.inf, P.inf) == i.atomics()
+
 
 class TestIntervalUnion:
     def test_atomic(self):
@@ -616,6 +954,27 @@ class TestIntervalUnion:
     def test_with_empty(self):
         assert P.closed(0, 1) | P.empty() == P.closed(0, 1)
 
+    def test_with_many_atomics(self):
+        i1 = P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 100, 4)])
+        i2 = P.Interval(*[P.closedopen(x, x + 1) for x in range(2, 100, 4)])
+        assert i1 | i2 == P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 100, 2)])
+        assert i1 | i2 == i2 | i1
+
+        i3 = P.Interval(*[P.closed(x, x + 2) for x in range(-1, 100, 4)])
+        assert i1 | i3 == i3
+        assert i2 | i3 == P.Interval(*[P.closed(x, x + 2) for x in range(-1, 100, 4)], *[P.closed(x, x + 3) for x in range(2, 100, 4)])
+        assert len(i2 | i3) == 26
+
+    def test_with_small_and_large(self):
+        large = P.Interval(*[P.open(x, x + 1) for x in range(100)])
+        assert len(large | P.closed(10, 20)) == 89
+        assert large | P.closed(10, 20) == P.closed(10, 20) | large
+        assert large | P.singleton(50) == P.open(49, 51) | large
+        assert large | P.singleton(50) | P.singleton(51) == P.open(49, 52) | large
+        assert large | P.closed(-5, -1) | P.closed(200, 201) == P.Interval(P.closed(-5, -1), large, P.closed(200, 201))
+        assert large | P.open(-P.inf, 0) | P.closedopen(101, P.inf) == P.Interval(P.open(-P.inf, 0), large, P.closedopen(101, P.inf))
+        assert large | (P.singleton(0) | P.singleton(100)) == large | P.singleton(0) | P.singleton(100)
+
     def test_issue_12(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/12
         assert P.open(0, 2) | P.closed(0, 2) == P.closed(0, 2)
@@ -667,6 +1026,16 @@ class TestIntervalUnion:
         with pytest.raises(TypeError):
             P.closed(0, 1) | 1
 
+    def test_union_all(self):
+        intervals = [P.closed(i, i + 1) if i % 3 else P.open(i, i + 2) for i in range(0, 30, 2)]
+        assert P.Interval.union_all(intervals) == P.Interval(*intervals)
+        assert P.Interval.union_all(reversed(intervals)) == P.Interval(*intervals)
+        assert P.Interval.union_all([P.closed(0, 1) | P.closed(4, 5), P.open(1, 4)]) == P.closed(0, 5)
+        assert P.Interval.union_all([]) == P.empty()
+
+        with pytest.raises(TypeError):
+            P.Interval.union_all([P.closed(0, 1), 1])
+
 
 class TestIntervalComplement:
     def test_singleton(self):
@@ -691,6 +1060,11 @@ class TestIntervalComplement:
         assert (~P.closed(-P.inf, P.inf)).empty
         assert ~P.empty() == P.open(-P.inf, P.inf)
 
+    def test_with_many_atomics(self):
+        i = P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 100, 2)])
+        assert ~i == P.open(-P.inf, 0) | P.Interval(*[P.closedopen(x, x + 1) for x in range(1, 99, 2)]) | P.closedopen(99, P.inf)
+        assert ~~i == i
+
     def test_proxy_method(self):
         i1, i2 = P.closed(0, 1), P.closed(2, 3)
         assert ~i1 == i1.complement()
@@ -726,6 +1100,20 @@ class TestIntervalDifference:
         assert P.closed(0, 2) - P.closed(-2, 1) == P.openclosed(1, 2)
         assert P.closed(0, 2) - P.open(-2, 1) == P.closed(1, 2)
 
+    def test_with_unions(self):
+        i = P.closed(0, 10) | P.closed(20, 30) | P.open(40, P.inf)
+        assert i - (P.open(5, 25) | P.closed(29, 41)) == P.closed(0, 5) | P.closedopen(25, 29) | P.open(41, P.inf)
+        assert i - P.Interval(*[P.singleton(x) for x in range(0, 50, 5)]) == (
+            P.open(0, 5) | P.open(5, 10) | P.open(20, 25) | P.open(25, 30) | P.open(40, 45) | P.open(45, P.inf)
+        )
+        assert i - (P.openclosed(-P.inf, 0) | P.closedopen(10, 20) | P.singleton(30)) == P.open(0, 10) | P.closedopen(20, 30) | P.open(40, P.inf)
+        assert P.open(-P.inf, P.inf) - i == ~i
+
+    def test_with_infinities(self):
+        assert P.open(-P.inf, P.inf) - P.open(-P.inf, 0) == P.closedopen(0, P.inf)
+        assert P.open(-P.inf, P.inf) - P.open(0, P.inf) == P.openclosed(-P.inf, 0)
+        assert P.open(-P.inf, 0) - P.open(-P.inf, P.inf) == P.empty()
+
     def test_proxy_method(self):
         i1, i2 = P.closed(0, 1), P.closed(2, 3)
         assert i1 - i2 == i1.difference(i2)
@@ -775,3 +1163,25 @@ class TestIntervalIteration:
         assert list(P.empty()) == []
         with pytest.raises(IndexError):
             P.empty()[0]
+
+    def test_atomics(self):
+        i1 = P.closed(10, 10) | P.closed(5, 6) | P.openclosed(7, 8)
+        atomics = i1.atomics()
+        assert len(atomics) == 3
+        assert atomics[0] == (P.CLOSED, 5, 6, P.CLOSED)
+        assert atomics[-1] == (P.CLOSED, 10, 10, P.CLOSED)
+        assert atomics[1].left == P.OPEN and atomics[1].upper == 8
+        assert list(atomics) == [tuple(i) for i in atomics]
+        assert list(reversed(atomics)) == list(atomics)[::-1]
+        assert list(atomics[1:]) == list(i1[1:].atomics())
+        assert [P.Interval.from_atomic(*a) for a in atomics] == list(i1)
+        assert (P.CLOSED, 5, 6, P.CLOSED) in atomics
+        assert atomics.index((P.CLOSED, 10, 10, P.CLOSED)) == 2
+        with pytest.raises(IndexError):
+            atomics[3]
+        with pytest.raises(TypeError):
+            atomics[0] = (P.CLOSED, 0, 1, P.CLOSED)
+
+    def test_atomics_with_empty(self):
+        assert len(P.empty().atomics()) == 0
+        assert list(P.empty().atomics()) == []
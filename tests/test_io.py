@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 import portion as P
@@ -125,6 +127,84 @@ class TestFromString:
             P.from_string(case, int)
 
 
+class TestFromStrings:
+    def test_strings(self):
+        strings = ['[0,1]', '(0,1] | [2,3)', '()', '(-inf,+inf)']
+        assert list(P.from_strings(strings, int)) == [P.from_string(s, int) for s in strings]
+
+    def test_is_lazy(self):
+        intervals = P.from_strings(iter(['[0,1]', '[', '[2,3]']), int)
+        assert next(intervals) == P.closed(0, 1)
+        with pytest.raises(ValueError):
+            next(intervals)
+
+    def test_parameters(self):
+        params = {'conv': int, 'disj': ' or ', 'left_closed': '<', 'right_closed': '>'}
+        assert list(P.from_strings(['<0,1> or <2>'], **params)) == [P.closed(0, 1) | P.singleton(2)]
+
+    def test_cache(self):
+        calls = []
+
+        def conv(s):
+            calls.append(s)
+            return int(s)
+
+        strings = ['[0,1]', '[2,3]', '[0,1]', '[4,5]', '[0,1]']
+        intervals = list(P.from_strings(strings, conv, cache_size=2))
+        assert intervals == [P.from_string(s, int) for s in strings]
+        assert calls == ['0', '1', '2', '3', '4', '5']
+
+        calls.clear()
+        list(P.from_strings(strings, conv))
+        assert len(calls) == 10
+
+
+class TestDefaultSyntax:
+    @pytest.mark.parametrize('string', [
+        '[0,1]', '(0, 1)', '[0]', '()', '(-inf,+inf)', '[1,+inf)', '[0,1]|[2,3]', '[0,1] |(2,3)',
+        '[,1]', '[0,1,2]', '(0,)1]', '[0, ]]', '[0, ]', '[0 ,1]', '[0,1]  | [2,3]', '[0,1] |  [2,3]',
+        '[0,1]\n', '[\n0,1]', '[0,1] | ', '[0', '',
+    ])
+    def test_same_as_patterns(self, string):
+        # Patterns that are equivalent to the default ones, but not parsed by the scanner
+        params = {'bound': '.+?', 'disj': ' ?[|] ?', 'sep': ',( )?'}
+        try:
+            expected = P.from_string(string, str, **params)
+        except ValueError:
+            with pytest.raises(ValueError):
+                P.from_string(string, str)
+        else:
+            assert P.from_string(string, str) == expected
+            assert P.from_string(string, str).atomics() == expected.atomics()
+
+    def test_custom_infinities(self):
+        assert P.from_string('(-inf,+inf)', float, klass=P.FloatInterval).lower == float('-inf')
+
+
+class TestFile:
+    def test_from_file(self):
+        file = io.StringIO('[0,1]\n(2,3] | [4,5)\n()\n')
+        assert list(P.from_file(file, int)) == [P.closed(0, 1), P.openclosed(2, 3) | P.closedopen(4, 5), P.empty()]
+
+    def test_to_file(self):
+        file = io.StringIO()
+        P.to_file([P.closed(0, 1), P.openclosed(2, 3) | P.closedopen(4, 5), P.empty()], file)
+        assert file.getvalue() == '[0,1]\n(2,3] | [4,5)\n()\n'
+
+    def test_parameters(self):
+        file = io.StringIO()
+        P.to_file([P.closed(0, 1) | P.singleton(2)], file, disj=' or ', left_closed='<', right_closed='>')
+        file.seek(0)
+        assert list(P.from_file(file, int, disj=' or ', left_closed='<', right_closed='>')) == [P.closed(0, 1) | P.singleton(2)]
+
+    def test_identity(self):
+        intervals = [P.closed(0, 1), P.open(-P.inf, 1) | P.singleton(3), P.empty(), P.open(0, P.inf)]
+        file = io.StringIO()
+        P.to_file(intervals, file)
+        file.seek(0)
+        assert list(P.from_file(file, int)) == intervals
+
+
 class TestStringIdentity:
     def test_identity(self):
         i1, i2, i3, i4 = P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1)
@@ -198,6 +278,59 @@ class TestFromData:
         assert P.from_data(d, conv=int, pinf='highest', ninf='lowest') == P.openclosed(-P.inf, 4) | P.closedopen(6, P.inf)
 
 
+class TestIterData:
+    def test_iter_data(self):
+        i = P.openclosed(-P.inf, 0) | P.closed(2, 3) | P.singleton(5)
+        data = P.iter_data(i)
+        assert not isinstance(data, list)
+        assert list(data) == P.to_data(i)
+
+    def test_parameters(self):
+        i = P.openclosed(-P.inf, 0) | P.closedopen(2, P.inf)
+        assert list(P.iter_data(i, conv=str, pinf='highest', ninf='lowest')) == [
+            (False, 'lowest', '0', True), (True, '2', 'highest', False)
+        ]
+
+
+class TestTrustedData:
+    @pytest.mark.parametrize('interval', [
+        P.empty(), P.closed(0, 1), P.singleton(0), P.open(-P.inf, P.inf),
+        P.openclosed(-P.inf, 0) | P.closed(2, 3) | P.closedopen(5, P.inf),
+    ])
+    def test_identity(self, interval):
+        data = P.to_data(interval)
+        assert P.from_data(data, trusted=True) == interval
+        assert P.from_data(data, trusted=True).atomics() == interval.atomics()
+        assert P.from_data(iter(data), trusted=True) == interval
+
+    def test_parameters(self):
+        d = [(False, 'lowest', '4', True), (True, '6', 'highest', False)]
+        i = P.from_data(d, conv=int, pinf='highest', ninf='lowest', trusted=True)
+        assert i == P.openclosed(-P.inf, 4) | P.closedopen(6, P.inf)
+
+    def test_single_pass(self):
+        converted = []
+
+        def conv(value):
+            converted.append(value)
+            return int(value)
+
+        d = ((i % 2 == 0, str(i), str(i + 1), True) for i in range(0, 10, 3))
+        i = P.from_data(d, conv=conv, pinf='highest', ninf='lowest', trusted=True)
+        assert i == P.closed(0, 1) | P.openclosed(3, 4) | P.closed(6, 7) | P.openclosed(9, 10)
+        assert converted == ['0', '1', '3', '4', '6', '7', '9', '10']
+
+    def test_lists(self):
+        # e.g., as decoded from JSON
+        d = [[False, float('-inf'), 4, True], [True, 6, 8, True]]
+        assert P.from_data(d, trusted=True) == P.openclosed(-P.inf, 4) | P.closed(6, 8)
+
+    def test_klass(self):
+        i = P.from_data([(False, float('-inf'), 0.5, True)], klass=P.FloatInterval, trusted=True)
+        assert isinstance(i, P.FloatInterval)
+        assert i.lower == float('-inf')
+
+
 class TestDataIdentity:
     def test_identity(self):
         i1, i2, i3, i4 = P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1)
@@ -206,3 +339,148 @@ class TestDataIdentity:
         assert P.from_data(P.to_data(i3)) == i3
         assert P.from_data(P.to_data(i4)) == i4
         assert P.from_data(P.to_data(i1)) == i1
+
+
+class TestBytes:
+    @pytest.mark.parametrize('interval', [
+        P.empty(),
+        P.closed(0, 1),
+        P.singleton(-3),
+        P.open(-P.inf, P.inf),
+        P.openclosed(-P.inf, 0) | P.closed(2, 2) | P.closedopen(5, P.inf),
+        P.closed(-10 ** 30, 10 ** 30),
+        P.open(0.5, 1.25) | P.closed(3, 4.5),
+        P.Interval.from_atomics([(P.CLOSED, i, i + 1, P.OPEN) for i in range(0, 1000, 2)]),
+    ])
+    def test_identity(self, interval):
+        for compress in [False, True]:
+            data = P.to_bytes(interval, compress=compress)
+            assert isinstance(data, bytes)
+            assert P.from_bytes(data) == interval
+            assert P.from_bytes(data).atomics() == interval.atomics()
+
+    def test_is_compact(self):
+        interval = P.Interval.from_atomics([(P.CLOSED, i, i + 1, P.OPEN) for i in range(0, 1000, 2)])
+        assert len(P.to_bytes(interval)) < 1200
+        assert len(P.to_bytes(interval, compress=True)) < 100
+
+    def test_parameters(self):
+        i = P.closed('0', '1') | P.openclosed('3', P.inf)
+        assert P.from_bytes(P.to_bytes(i, conv=int), conv=str) == i
+
+    def test_unsupported_bounds(self):
+        with pytest.raises(TypeError):
+            P.to_bytes(P.closed('a', 'b'))
+        with pytest.raises(TypeError):
+            P.to_bytes(1)
+
+    def test_klass(self):
+        i = P.from_bytes(P.to_bytes(P.open(-P.inf, 1)), klass=P.FloatInterval)
+        assert isinstance(i, P.FloatInterval)
+        assert i.lower == float('-inf')
+
+        F = P.create_api(P.FloatInterval)
+        assert isinstance(F.from_bytes(F.to_bytes(F.closed(0, 1))), P.FloatInterval)
+
+    @pytest.mark.parametrize('data', [b'', b'\x00', b'\x02\x00', b'\x01\x00\x05', b'\x01\x01\x00'])
+    def test_invalid_bytes(self, data):
+        with pytest.raises(ValueError):
+            P.from_bytes(data)
+
+    def test_truncated_bytes(self):
+        data = P.to_bytes(P.closed(0, 1000) | P.closed(2000, 3000))
+        for i in range(len(data)):
+            with pytest.raises(ValueError):
+                P.from_bytes(data[:i])
+        with pytest.raises(ValueError):
+            P.from_bytes(data + b'\x00')
+
+
+class TestDictBytes:
+    def test_identity(self):
+        d = P.IntervalDict([
+            (P.openclosed(-P.inf, 0), None), (P.closed(1, 2), 'a'), (P.open(3, 4), 1),
+            (P.closed(5, 6), 'a'), (P.closed(7, 8), 2.5), (P.closed(9, 10), b'b'), (P.open(11, P.inf), True),
+        ])
+        for compress in [False, True]:
+            result = P.from_bytes(P.to_bytes(d, compress=compress))
+            assert isinstance(result, P.IntervalDict)
+            assert result == d
+            assert [type(v) for v in result.values()] == [type(v) for v in d.values()]
+
+    def test_empty(self):
+        assert P.from_bytes(P.to_bytes(P.IntervalDict())) == P.IntervalDict()
+
+    def test_values_are_shared(self):
+        d = P.IntervalDict([(P.closed(i, i + 0.5), 'some value') for i in range(100)])
+        assert len(P.to_bytes(d)) < len(P.to_bytes(d.domain())) + 250
+
+    def test_is_usable(self):
+        d = P.IntervalDict([(P.closed(0, 2), 'a'), (P.closed(4, 6), 'b')])
+        result = P.from_bytes(P.to_bytes(d))
+        assert result[1] == 'a'
+        result[P.closed(1, 5)] = 'c'
+        d[P.closed(1, 5)] = 'c'
+        assert result == d
+
+    def test_dumps(self):
+        d = P.IntervalDict([(P.closed(0, 1), [1, 2]), (P.closed(2, 3), {'a': 1})])
+        with pytest.raises(TypeError):
+            P.to_bytes(d)
+
+        data = P.to_bytes(d, dumps=lambda v: repr(v).encode())
+        assert P.from_bytes(data, loads=lambda b: eval(b.decode())) == d
+        with pytest.raises(ValueError):
+            P.from_bytes(data)
+
+    def test_dict_klass(self):
+        D = P.create_api(P.FloatInterval)
+        d = D.IntervalDict([(D.closed(0, 1), 'a')])
+        result = D.from_bytes(D.to_bytes(d))
+        assert isinstance(result, D.IntervalDict)
+        assert isinstance(result.domain(), P.FloatInterval)
+        assert result == d
+
+
+class TestArrays:
+    def test_to_arrays(self):
+        numpy = pytest.importorskip('numpy')
+        lowers, uppers, left_closed, right_closed = P.to_arrays(P.openclosed(-P.inf, 0) | P.closedopen(2, P.inf))
+        assert lowers.tolist() == [float('-inf'), 2]
+        assert uppers.tolist() == [0, float('inf')]
+        assert left_closed.tolist() == [False, True]
+        assert right_closed.tolist() == [True, False]
+        assert all(isinstance(column, numpy.ndarray) for column in P.to_arrays(P.empty()))
+        assert all(len(column) == 0 for column in P.to_arrays(P.empty()))
+
+    def test_from_arrays(self):
+        numpy = pytest.importorskip('numpy')
+        lowers = numpy.array([5, 0, 2, 1, float('-inf'), 8, 9])
+        uppers = numpy.array([6, 1, 3, 2, -3, 8, 9])
+        left_closed = numpy.array([True, True, False, True, True, True, False])
+        right_closed = numpy.array([False, False, True, True, True, True, True])
+        assert P.from_arrays(lowers, uppers, left_closed, right_closed) == (
+            P.openclosed(-P.inf, -3) | P.closed(0, 3) | P.closedopen(5, 6) | P.singleton(8)
+        )
+
+    def test_from_arrays_with_scalars(self):
+        pytest.importorskip('numpy')
+        assert P.from_arrays([0, 2, 1], [1, 3, 2], True, False) == P.closedopen(0, 3)
+        assert P.from_arrays([], [], True, True) == P.empty()
+
+    def test_canonical(self):
+        pytest.importorskip('numpy')
+        i = P.openclosed(-P.inf, 0) | P.closed(2, 3) | P.open(4, P.inf)
+        assert P.from_arrays(*P.to_arrays(i), canonical=True) == i
+        assert P.from_arrays(*P.to_arrays(i), canonical=True).atomics() == i.atomics()
+        assert P.from_arrays(*P.to_arrays(P.empty()), canonical=True) == P.empty()
+
+    def test_klass(self):
+        pytest.importorskip('numpy')
+        i = P.from_arrays([0, 2], [1, 3], True, True, klass=P.IntInterval)
+        assert isinstance(i, P.IntInterval)
+        assert i == P.closed(0, 3, klass=P.IntInterval)
+
+        i = P.from_arrays([float('-inf')], [1.5], False, True, klass=P.FloatInterval)
+        assert isinstance(i, P.FloatInterval)
+        assert i.lower == float('-inf')
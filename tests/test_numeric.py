@@ -0,0 +1,112 @@
+import pytest
+
+import portion as P
+
+
+F = P.create_api(P.FloatInterval)
+I = P.create_api(P.IntInterval)
+
+
+class TestFloatInterval:
+    def test_infinities(self):
+        assert F.inf == float('inf')
+        assert F.closed(0, F.inf).upper == float('inf')
+        assert F.closed(0, P.inf).upper == float('inf')
+        assert F.closed(-P.inf, 0).lower == float('-inf')
+        assert F.closed(0, F.inf).right == P.OPEN
+        assert F.closed(-F.inf, 0).left == P.OPEN
+        assert F.empty().lower == float('inf') and F.empty().upper == float('-inf')
+        assert type((~F.closed(0, 1)).lower) is float
+
+    def test_operations(self):
+        i1 = F.closed(0, 2) | F.closedopen(4, F.inf)
+        i2 = F.open(1, 5)
+        p1 = P.closed(0, 2) | P.closedopen(4, P.inf)
+        p2 = P.open(1, 5)
+        assert P.to_data(i1 | i2) == P.to_data(p1 | p2)
+        assert P.to_data(i1 & i2) == P.to_data(p1 & p2)
+        assert P.to_data(i1 - i2) == P.to_data(p1 - p2)
+        assert P.to_data(~i1) == P.to_data(~p1)
+        assert isinstance(~i1, P.FloatInterval)
+        assert 10 ** 10 in i1 and float('inf') not in i1
+        assert F.open(-F.inf, F.inf) == ~F.empty()
+
+    def test_replace(self):
+        i = F.closedopen(0, F.inf)
+        assert i.replace(lower=lambda v: v + 1, upper=lambda v: v + 1) == F.closedopen(1, F.inf)
+        assert i.replace(upper=5, right=P.CLOSED) == F.closed(0, 5)
+
+    def test_io(self):
+        i = F.openclosed(-F.inf, 0) | F.closed(1, 2) | F.open(3, F.inf)
+        p = P.openclosed(-P.inf, 0) | P.closed(1, 2) | P.open(3, P.inf)
+        assert F.to_string(i) == P.to_string(p)
+        assert F.from_string(F.to_string(i), int) == i
+        assert F.to_data(i) == P.to_data(p)
+        assert F.from_data(F.to_data(i)) == i
+        assert F.from_data(P.to_data(p)).atomics() == i.atomics()
+
+
+class TestIntInterval:
+    def test_infinities(self):
+        assert I.inf == float('inf')
+        assert I.open(-I.inf, I.inf).lower == float('-inf')
+        assert I.closed(-P.inf, P.inf) == I.open(-I.inf, I.inf)
+
+    def test_compact_storage(self):
+        for i in [I.empty(), I.closed(0, 1), I.closed(-I.inf, 0), I.closed(0, 1) | I.closed(3, 4)]:
+            assert not hasattr(i, '__dict__')
+        assert not hasattr(F.closed(0, 1), '__dict__')
+
+    def test_discrete(self):
+        assert I.open(0, 5) == I.closed(1, 4)
+        assert I.openclosed(0, 1) == I.singleton(1)
+        assert I.open(0, 1).empty
+        assert I.closed(0, 1) | I.closed(2, 3) == I.closed(0, 3)
+        assert ~I.closed(0, 3) == I.closed(-I.inf, -1) | I.closed(4, I.inf)
+        assert I.closed(0, 5) - I.singleton(2) == I.closed(0, 1) | I.closed(3, 5)
+        assert isinstance(I.closed(0, 5) - I.singleton(2), P.IntInterval)
+        assert list(I.iterate(I.open(0, 4), step=1)) == [1, 2, 3]
+
+    def test_io(self):
+        i = I.closed(-I.inf, 0) | I.closed(2, I.inf)
+        assert I.to_string(i) == '(-inf,0] | [2,+inf)'
+        assert I.from_string(I.to_string(i), int) == i
+        assert I.from_data(I.to_data(i)) == i
+
+    def test_merge(self):
+        assert I.closed(0, 1) | I.closed(2, 3) == I.closed(0, 3)
+        assert I.closed(0, 1) | I.closed(3, 4) != I.closed(0, 4)
+        assert I.Interval(I.closed(5, 6), I.singleton(4), I.closed(0, 3)) == I.closed(0, 6)
+        assert I.closed(-I.inf, 0) | I.closed(1, I.inf) == I.open(-I.inf, I.inf)
+        assert I.closed(0, 1).adjacent(I.closed(2, 3))
+        assert I.closed(0, 1).relation(I.closed(2, 3)) == P.Relation.MEETS
+
+    def test_cardinality(self):
+        assert I.closed(0, 4).cardinality() == 5
+        assert (I.closed(0, 4) | I.open(10, 13)).cardinality() == 7
+        assert I.singleton(3).cardinality() == 1
+        assert I.empty().cardinality() == 0
+        assert I.closed(0, I.inf).cardinality() == float('inf')
+        assert I.closed(-I.inf, 0).cardinality() == float('inf')
+
+    def test_to_ranges(self):
+        assert (I.closed(0, 4) | I.open(10, 13)).to_ranges() == [range(0, 5), range(11, 13)]
+        assert I.empty().to_ranges() == []
+        assert [v for r in (I.closed(0, 2) | I.singleton(5)).to_ranges() for v in r] == [0, 1, 2, 5]
+
+        with pytest.raises(ValueError):
+            I.closed(0, I.inf).to_ranges()
+
+    def test_from_other_classes(self):
+        # Atomic intervals of other classes are normalized when creating intervals
+        i = I.Interval(P.open(0, 5))
+        assert i == I.closed(1, 4)
+        assert i.cardinality() == 4
+        assert i.to_ranges() == [range(1, 5)]
+
+        i = I.Interval(P.closed(0, P.inf), P.closed(-5, -3))
+        assert i == I.closed(-5, -3) | I.closed(0, I.inf)
+        assert i.upper == float('inf')
+        assert I.closed(10, 12) | P.closed(0, P.inf) == I.closed(0, I.inf)
+        assert I.Interval(P.closed(0, P.inf)).cardinality() == float('inf')
+        assert I.Interval.union_all([P.open(0, 5), P.closedopen(5, 7)]) == I.closed(1, 6)